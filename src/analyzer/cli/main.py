@@ -2,18 +2,18 @@
 Command-line interface for the Java Code Analyzer.
 """
 
+from contextlib import nullcontext
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, RenderableType
 from rich.panel import Panel
 
-from analyzer.core.agent import CodeAnalysisAgent
-from analyzer.llm.groq_client import GroqLLMClient
-from analyzer.tools.registry import register_default_tools
-from analyzer.utils.logger import setup_logger
-from config.settings import settings
+from config.settings import get_settings
+
+# Agent, LLM, tool and logging modules (and the Groq SDK behind them) are
+# imported inside the commands that need them, so `--help`, `version` and
+# `config` start without loading them.
 
 app = typer.Typer(
     name="java-analyzer",
@@ -23,6 +23,15 @@ app = typer.Typer(
 console = Console()
 
 
+def _render_report(report: str) -> RenderableType:
+    """Render a report as Markdown if it contains markdown syntax."""
+    if "```" in report or "#" in report[:50]:
+        from rich.markdown import Markdown
+
+        return Markdown(report)
+    return report
+
+
 @app.command()
 def analyze(
     file_path: str = typer.Argument(..., help="Path to Java file to analyze"),
@@ -38,6 +47,13 @@ def analyze(
         java-analyzer analyze MyCode.java
         java-analyzer analyze src/Main.java --verbose
     """
+    from analyzer.core.agent import CodeAnalysisAgent
+    from analyzer.llm.groq_client import GroqLLMClient
+    from analyzer.tools.registry import register_default_tools
+    from analyzer.utils.logger import setup_logger
+
+    settings = get_settings()
+
     # Setup logging
     setup_logger()
 
@@ -91,18 +107,37 @@ def analyze(
             for tool in tool_registry.get_all_tools():
                 console.print(f"  • {tool.name}: {tool.description[:60]}...")
 
+        # Outside verbose mode, show the report while it streams in. The live
+        # view is cleared on completion and replaced by the final render below.
+        live = None
+        streamed = [""]
+        if not verbose:
+            from rich.live import Live
+
+            live = Live(
+                get_renderable=lambda: _render_report(streamed[0]),
+                console=console,
+                transient=True,
+                vertical_overflow="crop",
+            )
+
+        def show_partial_report(text: str) -> None:
+            streamed[0] = text
+
         # Create agent
         agent = CodeAnalysisAgent(
             llm=llm,
             tool_registry=tool_registry,
             max_iterations=max_iterations or settings.max_iterations,
             verbose=verbose,
+            stream_callback=show_partial_report if live else None,
         )
 
         # Run analysis
         console.print("\n" + "=" * 70)
 
-        result = agent.analyze_file(str(path.absolute()))
+        with live or nullcontext():
+            result = agent.analyze_file(str(path.absolute()))
 
         # Display result
         console.print("\n" + "=" * 70)
@@ -114,11 +149,7 @@ def analyze(
         )
         console.print("\n")
 
-        # Render result as markdown if it contains markdown syntax
-        if "```" in result or "#" in result[:50]:
-            console.print(Markdown(result))
-        else:
-            console.print(result)
+        console.print(_render_report(result))
 
         console.print("\n" + "=" * 70)
 
@@ -140,6 +171,7 @@ def version():
     """Show version information."""
     from analyzer import __version__
 
+    settings = get_settings()
     console.print(f"Java Code Analyzer version {__version__}")
     console.print(f"LLM: {settings.primary_llm}")
     console.print(f"Environment: {settings.environment}")
@@ -148,6 +180,9 @@ def version():
 @app.command()
 def tools():
     """List available analysis tools."""
+    from analyzer.tools.registry import register_default_tools
+    from analyzer.utils.logger import setup_logger
+
     setup_logger()
 
     console.print(
@@ -174,6 +209,8 @@ def tools():
 @app.command()
 def config():
     """Show current configuration."""
+    settings = get_settings()
+
     console.print(
         Panel.fit(
             "⚙️  [bold]Current Configuration[/bold]",
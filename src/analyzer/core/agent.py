@@ -2,16 +2,27 @@
 The core agent - autonomous code analysis AI.
 """
 
+import asyncio
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import cache
+from typing import Any
 
 from loguru import logger
 from rich.console import Console
 from rich.panel import Panel
 
-from analyzer.llm.base import BaseLLM, Message
+from analyzer.llm.base import BaseLLM, LLMResponse, Message, ToolCall
 from analyzer.tools.registry import ToolRegistry
 from analyzer.utils.exceptions import AgentError, AgentTimeoutError, ToolExecutionError
 
-console = Console()
+
+@cache
+def _console() -> Console:
+    """Console for verbose output, created on first use."""
+    return Console(highlight=False, soft_wrap=False)
 
 
 class CodeAnalysisAgent:
@@ -55,12 +66,30 @@ Important guidelines:
 
 Think step by step and explain your reasoning as you work."""
 
+    # System prompt in API format, built once and shared (read-only) by all
+    # agents. Subclasses that override SYSTEM_PROMPT must override this too.
+    _SYSTEM_MESSAGE_DICT = {"role": "system", "content": SYSTEM_PROMPT}
+
+    # Upper bound on tools executed concurrently within a single turn
+    MAX_PARALLEL_TOOLS = 8
+
+    # History compaction: once the transcript would use more than
+    # HISTORY_BUDGET_RATIO of the model's context window, tool results older
+    # than the last HISTORY_KEEP_TOOL_RESULTS are cut to COMPACTED_TOOL_RESULT_CHARS
+    HISTORY_BUDGET_RATIO = 0.75
+    HISTORY_KEEP_TOOL_RESULTS = 3
+    COMPACTED_TOOL_RESULT_CHARS = 500
+    CHARS_PER_TOKEN = 4  # Rough estimate, good enough for budgeting
+    _TRUNCATION_NOTE = "\n... [truncated to save context]"
+
     def __init__(
         self,
         llm: BaseLLM,
         tool_registry: ToolRegistry,
         max_iterations: int = 15,
         verbose: bool = False,
+        stream_callback: Callable[[str], None] | None = None,
+        fold_system_prompt: bool = False,
     ):
         """
         Initialize the agent.
@@ -70,17 +99,31 @@ Think step by step and explain your reasoning as you work."""
             tool_registry: Available tools
             max_iterations: Maximum agent loop iterations
             verbose: Print detailed execution logs
+            stream_callback: Called with the text generated so far in the
+                current turn as `analyze_file` streams LLM output
+            fold_system_prompt: Send the system prompt as part of the first
+                user message instead of as a separate system message. Leave
+                off for providers that cache the system message.
         """
         self.llm = llm
         self.tool_registry = tool_registry
         self.max_iterations = max_iterations
         self.verbose = verbose
+        self.stream_callback = stream_callback
+        self.fold_system_prompt = fold_system_prompt
 
-        # Conversation history
+        # Tool schemas sent with every turn. The registry is expected to stay
+        # unchanged while the agent is in use; these are never modified.
+        self._tool_schemas = tool_registry.get_tool_schemas() or None
+
+        # Conversation history, plus the same messages already converted to
+        # API format so each turn only serializes what was appended since
         self.messages: list[Message] = []
+        self._api_messages: list[dict[str, Any]] = []
+        self._history_chars = 0
 
         # Add system prompt
-        self.messages.append(Message(role="system", content=self.SYSTEM_PROMPT))
+        self._add_system_prompt()
 
         logger.info(
             f"Agent initialized with {len(tool_registry)} tools, "
@@ -107,10 +150,92 @@ Think step by step and explain your reasoning as you work."""
             AgentTimeoutError: If max iterations exceeded
             AgentError: If analysis fails
         """
+        self._start_analysis(file_path)
+
+        # Run agent loop
+        try:
+            final_report = self._agent_loop()
+            logger.info("Agent analysis complete")
+            return final_report
+        except Exception as e:
+            logger.error(f"Agent analysis failed: {str(e)}")
+            raise AgentError(f"Analysis failed: {str(e)}")
+
+    async def analyze_file_async(self, file_path: str) -> str:
+        """
+        Analyze a Java file without blocking the event loop.
+
+        Same as `analyze_file`, but LLM calls go through `llm.achat` and tools
+        run in a worker thread.
+
+        Args:
+            file_path: Path to Java file to analyze
+
+        Returns:
+            Final analysis report
+
+        Raises:
+            AgentTimeoutError: If max iterations exceeded
+            AgentError: If analysis fails
+        """
+        self._start_analysis(file_path)
+
+        # Run agent loop
+        try:
+            final_report = await self._agent_loop_async()
+            logger.info("Agent analysis complete")
+            return final_report
+        except Exception as e:
+            logger.error(f"Agent analysis failed: {str(e)}")
+            raise AgentError(f"Analysis failed: {str(e)}") from e
+
+    async def analyze_files(self, file_paths: list[str]) -> dict[str, str]:
+        """
+        Analyze several Java files concurrently.
+
+        Each file gets its own conversation (a fresh agent sharing this agent's
+        LLM client and tools), so total latency is close to that of the
+        slowest file rather than the sum.
+
+        Args:
+            file_paths: Paths to Java files to analyze
+
+        Returns:
+            Mapping of file path to final analysis report
+
+        Raises:
+            AgentError: If any analysis fails
+        """
+        agents = [self._spawn() for _ in file_paths]
+        reports = await asyncio.gather(
+            *(
+                agent.analyze_file_async(file_path)
+                for agent, file_path in zip(agents, file_paths, strict=True)
+            )
+        )
+        return dict(zip(file_paths, reports, strict=True))
+
+    def _spawn(self) -> "CodeAnalysisAgent":
+        """Create a fresh agent with the same configuration."""
+        return type(self)(
+            llm=self.llm,
+            tool_registry=self.tool_registry,
+            max_iterations=self.max_iterations,
+            verbose=self.verbose,
+            fold_system_prompt=self.fold_system_prompt,
+        )
+
+    def _start_analysis(self, file_path: str) -> None:
+        """
+        Add the analysis request for a file to the conversation.
+
+        Args:
+            file_path: Path to Java file to analyze
+        """
         logger.info(f"Agent starting analysis of: {file_path}")
 
         if self.verbose:
-            console.print(
+            _console().print(
                 Panel(
                     f"🤖 Starting autonomous analysis of:\n[bold]{file_path}[/bold]",
                     title="Agent Started",
@@ -123,16 +248,9 @@ Think step by step and explain your reasoning as you work."""
             f"Analyze the Java file at path: {file_path}\n\n"
             f"Perform a thorough analysis and provide actionable recommendations."
         )
-        self.messages.append(Message(role="user", content=user_message))
-
-        # Run agent loop
-        try:
-            final_report = self._agent_loop()
-            logger.info("Agent analysis complete")
-            return final_report
-        except Exception as e:
-            logger.error(f"Agent analysis failed: {str(e)}")
-            raise AgentError(f"Analysis failed: {str(e)}")
+        if self.fold_system_prompt and not self.messages:
+            user_message = f"{self.SYSTEM_PROMPT}\n\n---\n{user_message}"
+        self._add_message(Message(role="user", content=user_message))
 
     def _agent_loop(self) -> str:
         """
@@ -149,77 +267,221 @@ Think step by step and explain your reasoning as you work."""
 
         while iteration < self.max_iterations:
             iteration += 1
-
-            if self.verbose:
-                console.print(
-                    f"\n[bold cyan]🔄 Iteration {iteration}/{self.max_iterations}[/bold cyan]"
-                )
-
-            logger.debug(f"Agent loop iteration {iteration}")
-
-            # Get tool schemas for LLM
-            tool_schemas = self.tool_registry.get_tool_schemas()
+            self._start_iteration(iteration)
 
             # Ask LLM what to do next
             try:
-                response = self.llm.chat(
-                    messages=self.messages,
-                    tools=tool_schemas if tool_schemas else None,
-                )
+                response = self._chat(tools=self._tool_schemas)
             except Exception as e:
                 raise AgentError(f"LLM call failed: {str(e)}")
 
             # Check if LLM wants to use tools
             if response.has_tool_calls():
-                # Add assistant message with tool calls to history first
-                # This is required by the API before adding tool results
-                tool_calls_for_history = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": __import__("json").dumps(tc.parameters),
-                        },
-                    }
-                    for tc in response.tool_calls
-                ]
-                self.messages.append(
-                    Message(
-                        role="assistant",
-                        content=response.content,  # May be None
-                        tool_calls=tool_calls_for_history,
-                    )
-                )
+                self._record_tool_calls(response)
 
                 # Execute tools and continue loop
                 self._handle_tool_calls(response.tool_calls)
 
             else:
                 # LLM provided final answer
-                if response.content:
-                    if self.verbose:
-                        console.print(
-                            Panel(
-                                "✅ Agent has completed analysis",
-                                border_style="green",
-                            )
-                        )
-
-                    # Add to history
-                    self.messages.append(Message(role="assistant", content=response.content))
-
-                    logger.info(f"Agent finished after {iteration} iterations")
-                    return response.content
-                else:
-                    # No content and no tool calls - something wrong
-                    raise AgentError("LLM returned no content and no tool calls")
+                return self._finish(response, iteration)
 
         # Reached max iterations without final answer
+        self._request_final_summary()
+
+        try:
+            response = self._chat(tools=None)
+            return self._final_summary(response)
+        except Exception as e:
+            raise AgentError(f"Failed to get final summary: {str(e)}")
+
+    async def _agent_loop_async(self) -> str:
+        """
+        Async variant of `_agent_loop`.
+
+        Responses are streamed, and each tool call starts running in a worker
+        thread as soon as the stream completes it, so tool execution overlaps
+        with the rest of the LLM's output.
+
+        Returns:
+            Final analysis report
+        """
+        iteration = 0
+
+        while iteration < self.max_iterations:
+            iteration += 1
+            self._start_iteration(iteration)
+
+            # Ask LLM what to do next; requested tools start as they arrive
+            try:
+                response, tool_results = await self._astream_turn(tools=self._tool_schemas)
+            except Exception as e:
+                raise AgentError(f"LLM call failed: {str(e)}") from e
+
+            # Check if LLM wants to use tools
+            if response.has_tool_calls():
+                self._record_tool_calls(response)
+
+                # Wait for the tools and continue loop
+                self._add_tool_results(response.tool_calls, await asyncio.gather(*tool_results))
+
+            else:
+                # LLM provided final answer
+                return self._finish(response, iteration)
+
+        # Reached max iterations without final answer
+        self._request_final_summary()
+
+        try:
+            response, _ = await self._astream_turn(tools=None)
+            return self._final_summary(response)
+        except Exception as e:
+            raise AgentError(f"Failed to get final summary: {str(e)}") from e
+
+    async def _astream_turn(
+        self, tools: list[dict] | None
+    ) -> tuple[LLMResponse, list[asyncio.Future[str]]]:
+        """
+        Stream one LLM turn, starting each tool call as soon as it is complete.
+
+        Args:
+            tools: Tool schemas to offer, or None
+
+        Returns:
+            The complete response, and futures for its tool results in the
+            order the LLM emitted the calls
+        """
+        loop = asyncio.get_running_loop()
+        tool_results: list[asyncio.Future[str]] = []
+        parts: list[str] = []
+
+        try:
+            async for item in self.llm.astream_chat(
+                messages=self.messages, tools=tools, raw_messages=self._api_messages
+            ):
+                if isinstance(item, LLMResponse):
+                    return item, tool_results
+                if isinstance(item, ToolCall):
+                    tool_results.append(loop.run_in_executor(None, self._execute_tool_call, item))
+                elif self.stream_callback is not None:
+                    parts.append(item)
+                    self.stream_callback("".join(parts))
+
+            raise AgentError("LLM stream ended without a response")
+
+        except BaseException:
+            # Don't leave tools from a failed turn running unobserved
+            for future in tool_results:
+                future.cancel()
+            raise
+
+    def _chat(self, tools: list[dict] | None) -> LLMResponse:
+        """
+        Send the conversation to the LLM.
+
+        When a `stream_callback` is set the response is streamed, and the
+        callback receives the turn's text as it grows.
+
+        Args:
+            tools: Tool schemas to offer, or None
+
+        Returns:
+            Complete LLM response
+        """
+        if self.stream_callback is None:
+            return self.llm.chat(
+                messages=self.messages, tools=tools, raw_messages=self._api_messages
+            )
+
+        parts: list[str] = []
+        for item in self.llm.stream_chat(
+            messages=self.messages, tools=tools, raw_messages=self._api_messages
+        ):
+            if isinstance(item, LLMResponse):
+                return item
+            if isinstance(item, str):
+                parts.append(item)
+                self.stream_callback("".join(parts))
+
+        raise AgentError("LLM stream ended without a response")
+
+    def _start_iteration(self, iteration: int) -> None:
+        """Log the start of an agent loop iteration."""
+        if self.verbose:
+            _console().print(
+                f"\n[bold cyan]🔄 Iteration {iteration}/{self.max_iterations}[/bold cyan]"
+            )
+
+        logger.debug(f"Agent loop iteration {iteration}")
+
+        self._compact_history()
+
+    def _record_tool_calls(self, response: LLMResponse) -> None:
+        """
+        Add the assistant message carrying tool calls to history.
+
+        This is required by the API before adding tool results.
+
+        Args:
+            response: LLM response with tool calls
+        """
+        tool_calls_for_history = [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {
+                    "name": tc.name,
+                    "arguments": json.dumps(tc.parameters),
+                },
+            }
+            for tc in response.tool_calls
+        ]
+        self._add_message(
+            Message(
+                role="assistant",
+                content=response.content,  # May be None
+                tool_calls=tool_calls_for_history,
+            )
+        )
+
+    def _finish(self, response: LLMResponse, iteration: int) -> str:
+        """
+        Accept a response without tool calls as the final answer.
+
+        Args:
+            response: Final LLM response
+            iteration: Iteration the answer arrived in
+
+        Returns:
+            Final analysis report
+
+        Raises:
+            AgentError: If the response has no content
+        """
+        if not response.content:
+            # No content and no tool calls - something wrong
+            raise AgentError("LLM returned no content and no tool calls")
+
+        if self.verbose:
+            _console().print(
+                Panel(
+                    "✅ Agent has completed analysis",
+                    border_style="green",
+                )
+            )
+
+        # Add to history
+        self._add_message(Message(role="assistant", content=response.content))
+
+        logger.info(f"Agent finished after {iteration} iterations")
+        return response.content
+
+    def _request_final_summary(self) -> None:
+        """Ask the LLM to wrap up after hitting the iteration limit."""
         logger.warning(f"Agent reached max iterations ({self.max_iterations})")
 
         if self.verbose:
-            console.print(
+            _console().print(
                 Panel(
                     "⚠️  Reached maximum iterations, requesting final summary",
                     border_style="yellow",
@@ -227,81 +489,186 @@ Think step by step and explain your reasoning as you work."""
             )
 
         # Request final summary
-        self.messages.append(
+        self._add_message(
             Message(
                 role="user",
                 content="Please provide a final summary of your analysis now based on what you've learned so far.",
             )
         )
 
-        try:
-            response = self.llm.chat(messages=self.messages, tools=None)
-            if response.content:
-                return response.content
-            else:
-                raise AgentTimeoutError(
-                    f"Agent exceeded {self.max_iterations} iterations without completing analysis"
-                )
-        except Exception as e:
-            raise AgentError(f"Failed to get final summary: {str(e)}")
+        self._compact_history()
 
-    def _handle_tool_calls(self, tool_calls: list) -> None:
+    def _final_summary(self, response: LLMResponse) -> str:
         """
-        Execute tools requested by the agent.
+        Extract the final summary requested after the iteration limit.
 
         Args:
-            tool_calls: List of ToolCall objects
-        """
-        for tool_call in tool_calls:
-            tool_name = tool_call.name
-            parameters = tool_call.parameters
+            response: LLM response to the summary request
 
-            if self.verbose:
-                console.print(
-                    f"🔧 [bold]Agent decided to use:[/bold] {tool_name}",
-                    style="cyan",
-                )
-                if parameters:
-                    console.print(f"   Parameters: {parameters}", style="dim")
+        Returns:
+            Final analysis report
 
-            logger.info(f"Executing tool: {tool_name} with params: {parameters}")
+        Raises:
+            AgentTimeoutError: If the LLM returned no summary
+        """
+        if response.content:
+            return response.content
 
-            # Execute tool
-            try:
-                result = self.tool_registry.execute_tool(tool_name, **parameters)
+        raise AgentTimeoutError(
+            f"Agent exceeded {self.max_iterations} iterations without completing analysis"
+        )
+
+    def _handle_tool_calls(self, tool_calls: list) -> None:
+        """
+        Execute tools requested by the agent.
 
-                if self.verbose:
-                    # Show preview of result
-                    preview = result[:200] + "..." if len(result) > 200 else result
-                    console.print(f"   ✓ Result preview: {preview}", style="dim")
+        Independent calls emitted in the same turn run concurrently. Results
+        are added to the conversation in the order the LLM emitted them.
 
-                logger.debug(f"Tool {tool_name} executed successfully")
+        Args:
+            tool_calls: List of ToolCall objects
+        """
+        if len(tool_calls) <= 1:
+            results = [self._execute_tool_call(tool_call) for tool_call in tool_calls]
+        else:
+            workers = min(len(tool_calls), self.MAX_PARALLEL_TOOLS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._execute_tool_call, tool_call) for tool_call in tool_calls
+                ]
+                results = [future.result() for future in futures]
 
-            except ToolExecutionError as e:
-                # Tool failed - inform the agent
-                result = f"ERROR: {str(e)}"
-                logger.warning(f"Tool {tool_name} failed: {str(e)}")
+        self._add_tool_results(tool_calls, results)
 
-                if self.verbose:
-                    console.print(f"   ✗ Tool failed: {str(e)}", style="red")
+    def _add_tool_results(self, tool_calls: list, results: list[str]) -> None:
+        """
+        Add tool results to the conversation.
 
-            # Add tool result to conversation
-            self.messages.append(
+        Args:
+            tool_calls: ToolCall objects, in the order the LLM emitted them
+            results: Result for each tool call
+        """
+        for tool_call, result in zip(tool_calls, results, strict=True):
+            self._add_message(
                 Message(
                     role="tool",
                     content=result,
                     tool_call_id=tool_call.id,
-                    name=tool_name,
+                    name=tool_call.name,
                 )
             )
 
+    def _execute_tool_call(self, tool_call: ToolCall) -> str:
+        """
+        Execute a single tool call.
+
+        Args:
+            tool_call: ToolCall requested by the LLM
+
+        Returns:
+            Tool result, or an "ERROR: ..." message the agent can react to
+        """
+        tool_name = tool_call.name
+        parameters = tool_call.parameters
+
+        if self.verbose:
+            _console().print(
+                f"🔧 [bold]Agent decided to use:[/bold] {tool_name}",
+                style="cyan",
+            )
+            if parameters:
+                _console().print(f"   Parameters: {parameters}", style="dim", markup=False)
+
+        logger.info(f"Executing tool: {tool_name} with params: {parameters}")
+
+        try:
+            result = self.tool_registry.execute_tool(tool_name, **parameters)
+
+            if self.verbose:
+                # Show preview of result
+                preview = result[:200] + "..." if len(result) > 200 else result
+                _console().print(f"   ✓ Result preview: {preview}", style="dim", markup=False)
+
+            logger.debug(f"Tool {tool_name} executed successfully")
+
+        except ToolExecutionError as e:
+            # Tool failed - inform the agent
+            result = f"ERROR: {str(e)}"
+            logger.warning(f"Tool {tool_name} failed: {str(e)}")
+
+            if self.verbose:
+                _console().print(f"   ✗ Tool failed: {str(e)}", style="red", markup=False)
+
+        return result
+
+    def _add_message(self, message: Message) -> None:
+        """
+        Append a message to the conversation history.
+
+        Args:
+            message: Message to append
+        """
+        self.messages.append(message)
+        self._api_messages.append(message.to_dict())
+        self._history_chars += len(message.content or "")
+
+    def _add_system_prompt(self) -> None:
+        """
+        Start the conversation with the system prompt.
+
+        With `fold_system_prompt` the conversation starts empty instead and
+        the prompt is prepended to the first analysis request.
+        """
+        if self.fold_system_prompt:
+            return
+
+        self.messages.append(Message(role="system", content=self.SYSTEM_PROMPT))
+        self._api_messages.append(self._SYSTEM_MESSAGE_DICT)
+        self._history_chars += len(self.SYSTEM_PROMPT)
+
+    def _compact_history(self) -> None:
+        """
+        Shrink old tool results when the history nears the context budget.
+
+        Without this, every turn resends the full transcript and input tokens
+        grow quadratically over the loop. The system prompt, user messages,
+        assistant messages and the most recent tool results are kept
+        verbatim; older tool results are truncated where they are, which keeps
+        each tool call paired with its result as the API requires.
+        """
+        budget = self.llm.get_token_limit() * self.HISTORY_BUDGET_RATIO
+        if self._history_chars / self.CHARS_PER_TOKEN <= budget:
+            return
+
+        tool_indices = [i for i, msg in enumerate(self.messages) if msg.role == "tool"]
+        limit = self.COMPACTED_TOOL_RESULT_CHARS
+        compacted = 0
+
+        for i in tool_indices[: -self.HISTORY_KEEP_TOOL_RESULTS or None]:
+            message = self.messages[i]
+            content = message.content or ""
+            if len(content) <= limit + len(self._TRUNCATION_NOTE):
+                continue
+
+            truncated = content[:limit] + self._TRUNCATION_NOTE
+            self.messages[i] = replace(message, content=truncated)
+            self._api_messages[i] = self.messages[i].to_dict()
+            self._history_chars -= len(content) - len(truncated)
+            compacted += 1
+
+        if compacted:
+            logger.debug(f"Compacted {compacted} old tool result(s) to fit context budget")
+
     def get_conversation_history(self) -> list[Message]:
         """Get the conversation history."""
         return self.messages.copy()
 
     def reset(self) -> None:
         """Reset agent to initial state."""
-        self.messages = [Message(role="system", content=self.SYSTEM_PROMPT)]
+        self.messages = []
+        self._api_messages = []
+        self._history_chars = 0
+        self._add_system_prompt()
         logger.info("Agent reset")
 
     def __repr__(self) -> str:
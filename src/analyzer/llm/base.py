@@ -2,20 +2,22 @@
 Base interface for LLM clients.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel, Field
 
-
-class Message(BaseModel):
+@dataclass(slots=True)
+class Message:
     """A message in the conversation."""
 
-    role: str = Field(..., description="Role: 'system', 'user', 'assistant', or 'tool'")
-    content: str | None = Field(None, description="Message content")
-    tool_call_id: str | None = Field(None, description="ID of tool call (for tool responses)")
-    name: str | None = Field(None, description="Tool name (for tool responses)")
-    tool_calls: list[dict] | None = Field(None, description="Tool calls (for assistant messages)")
+    role: str  # "system", "user", "assistant", or "tool"
+    content: str | None = None
+    tool_call_id: str | None = None  # ID of tool call (for tool responses)
+    name: str | None = None  # Tool name (for tool responses)
+    tool_calls: list[dict] | None = None  # Tool calls (for assistant messages)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API calls."""
@@ -34,23 +36,23 @@ class Message(BaseModel):
         return data
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True)
+class ToolCall:
     """A tool call request from the LLM."""
 
-    id: str = Field(..., description="Unique tool call ID")
-    name: str = Field(..., description="Tool name to execute")
-    parameters: dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+    id: str  # Unique tool call ID
+    name: str  # Tool name to execute
+    parameters: dict[str, Any] = field(default_factory=dict)
 
 
-class LLMResponse(BaseModel):
+@dataclass(slots=True)
+class LLMResponse:
     """Response from the LLM."""
 
-    content: str | None = Field(None, description="Text response from LLM")
-    tool_calls: list[ToolCall] = Field(
-        default_factory=list, description="Tool calls requested by LLM"
-    )
-    finish_reason: str | None = Field(None, description="Why the LLM stopped")
-    raw_response: dict | None = Field(None, description="Raw API response")
+    content: str | None = None  # Text response from LLM
+    tool_calls: list[ToolCall] = field(default_factory=list)  # Tool calls requested by LLM
+    finish_reason: str | None = None  # Why the LLM stopped
+    raw_response: dict | None = None  # Raw API response (only kept when debugging)
 
     def has_tool_calls(self) -> bool:
         """Check if LLM wants to use tools."""
@@ -76,6 +78,7 @@ class BaseLLM(ABC):
         tools: list[dict] | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
     ) -> LLMResponse:
         """
         Send a chat request to the LLM.
@@ -85,6 +88,8 @@ class BaseLLM(ABC):
             tools: Available tools (function calling schemas)
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens to generate
+            raw_messages: `messages` already converted with `Message.to_dict`;
+                when given, clients send these instead of re-serializing
 
         Returns:
             LLM response with content or tool calls
@@ -95,6 +100,115 @@ class BaseLLM(ABC):
         """
         pass
 
+    async def achat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> LLMResponse:
+        """
+        Async variant of `chat`, so several conversations can run concurrently.
+
+        The default implementation runs `chat` in a worker thread; clients with
+        a native async SDK should override it.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools (function calling schemas)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            raw_messages: `messages` already converted with `Message.to_dict`
+
+        Returns:
+            LLM response with content or tool calls
+        """
+        return await asyncio.to_thread(
+            self.chat,
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            raw_messages=raw_messages,
+        )
+
+    def stream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> Iterator[str | ToolCall | LLMResponse]:
+        """
+        Stream a chat request, yielding output as it is generated.
+
+        The default implementation makes a regular `chat` call and yields its
+        content and tool calls in one piece; clients that support streaming
+        should override it.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools (function calling schemas)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            raw_messages: `messages` already converted with `Message.to_dict`
+
+        Yields:
+            Content fragments (str) and completed ToolCalls, then the complete
+            LLMResponse
+        """
+        response = self.chat(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            raw_messages=raw_messages,
+        )
+        if response.content:
+            yield response.content
+        yield from response.tool_calls
+        yield response
+
+    async def astream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[str | ToolCall | LLMResponse]:
+        """
+        Async variant of `stream_chat`.
+
+        The default implementation awaits `achat` and yields its content and
+        tool calls in one piece.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools (function calling schemas)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            raw_messages: `messages` already converted with `Message.to_dict`
+
+        Yields:
+            Content fragments (str) and completed ToolCalls, then the complete
+            LLMResponse
+        """
+        response = await self.achat(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            raw_messages=raw_messages,
+        )
+        if response.content:
+            yield response.content
+        for tool_call in response.tool_calls:
+            yield tool_call
+        yield response
+
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the name of the model being used."""
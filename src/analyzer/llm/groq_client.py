@@ -2,13 +2,22 @@
 Groq LLM client implementation.
 """
 
+import json
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, ClassVar, NoReturn
 
-from groq import Groq
 from loguru import logger
 
 from analyzer.llm.base import BaseLLM, LLMResponse, Message, ToolCall
 from analyzer.utils.exceptions import LLMConnectionError, LLMResponseError
 
+json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    json_loads = json.loads
+
 
 class GroqLLMClient(BaseLLM):
     """
@@ -17,12 +26,19 @@ class GroqLLMClient(BaseLLM):
     Groq provides free, fast inference for open models.
     """
 
+    # Sync SDK clients shared by all instances using the same API key, so
+    # repeated clients reuse one httpx connection pool instead of paying a new
+    # TCP+TLS handshake. httpx clients are safe to use from multiple threads.
+    _shared_clients: ClassVar[dict[str, Any]] = {}
+    _shared_clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         api_key: str,
         model: str = "llama-3.3-70b-versatile",
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        debug_raw: bool = False,
     ):
         """
         Initialize Groq client.
@@ -32,24 +48,52 @@ class GroqLLMClient(BaseLLM):
             model: Model name to use
             temperature: Sampling temperature
             max_tokens: Max tokens to generate
+            debug_raw: Keep the full API response dump on each LLMResponse
         """
         self.api_key = api_key
         self.model = model
         self.default_temperature = temperature
         self.default_max_tokens = max_tokens
+        self.debug_raw = debug_raw
+
+        # Imported here so loading this module doesn't pull in the Groq SDK
+        from groq import AsyncGroq
 
         try:
-            self.client = Groq(api_key=api_key)
+            self.client = self._get_shared_client(api_key)
+            # Async connections belong to the event loop that opened them, so
+            # each instance keeps its own async client
+            self.async_client = AsyncGroq(api_key=api_key)
             logger.info(f"Groq client initialized with model: {model}")
         except Exception as e:
             raise LLMConnectionError(f"Failed to initialize Groq client: {str(e)}")
 
+    @classmethod
+    def _get_shared_client(cls, api_key: str) -> Any:
+        """
+        Get the sync Groq client for an API key, creating it on first use.
+
+        Args:
+            api_key: Groq API key
+
+        Returns:
+            Shared `groq.Groq` client
+        """
+        with cls._shared_clients_lock:
+            client = cls._shared_clients.get(api_key)
+            if client is None:
+                from groq import Groq
+
+                client = cls._shared_clients[api_key] = Groq(api_key=api_key)
+            return client
+
     def chat(
         self,
         messages: list[Message],
         tools: list[dict] | None = None,
         temperature: float | None = None,
         max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
     ) -> LLMResponse:
         """
         Send chat request to Groq.
@@ -59,37 +103,14 @@ class GroqLLMClient(BaseLLM):
             tools: Available tools
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            raw_messages: Pre-serialized `messages`, sent as-is when given
 
         Returns:
             LLM response
         """
         try:
-            # Convert messages to API format
-            api_messages = [msg.to_dict() for msg in messages]
-
-            # Use lower temperature when tools are provided for more reliable tool calling
-            effective_temperature = temperature or self.default_temperature
-            if tools:
-                effective_temperature = min(effective_temperature, 0.3)
-
-            # Prepare request parameters
-            request_params = {
-                "model": self.model,
-                "messages": api_messages,
-                "temperature": effective_temperature,
-                "max_tokens": max_tokens or self.default_max_tokens,
-            }
-
-            # Add tools if provided
-            if tools:
-                request_params["tools"] = tools
-                request_params["tool_choice"] = "auto"
-                # Disable parallel tool calls to prevent malformed function call generation
-                request_params["parallel_tool_calls"] = False
-
-            logger.debug(
-                f"Sending request to Groq: {len(api_messages)} messages, "
-                f"{len(tools) if tools else 0} tools"
+            request_params = self._build_request(
+                messages, tools, temperature, max_tokens, raw_messages
             )
 
             # Make API call
@@ -99,21 +120,213 @@ class GroqLLMClient(BaseLLM):
             return self._parse_response(response)
 
         except Exception as e:
-            error_str = str(e)
-            logger.error(f"Groq API call failed: {error_str}")
-
-            # Check for tool_use_failed error - model generated malformed function calls
-            if "tool_use_failed" in error_str:
-                logger.warning(
-                    "Model generated malformed function call. "
-                    "This can happen with some Llama models. Consider using a different model."
-                )
-                raise LLMConnectionError(
-                    "Groq tool calling failed: The model generated an invalid function call format. "
-                    "Try using 'llama-3.1-70b-versatile' or 'llama3-70b-8192' instead."
-                )
+            self._raise_api_error(e)
+
+    async def achat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> LLMResponse:
+        """
+        Send chat request to Groq without blocking the event loop.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            raw_messages: Pre-serialized `messages`, sent as-is when given
+
+        Returns:
+            LLM response
+        """
+        try:
+            request_params = self._build_request(
+                messages, tools, temperature, max_tokens, raw_messages
+            )
+
+            # Make API call
+            response = await self.async_client.chat.completions.create(**request_params)
+
+            # Parse response
+            return self._parse_response(response)
+
+        except Exception as e:
+            self._raise_api_error(e)
+
+    def stream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> Iterator[str | ToolCall | LLMResponse]:
+        """
+        Stream a chat request to Groq.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            raw_messages: Pre-serialized `messages`, sent as-is when given
+
+        Yields:
+            Content fragments and completed ToolCalls as they arrive, then the
+            complete LLMResponse
+        """
+        assembler = _StreamAssembler(self._make_tool_call)
+
+        try:
+            request_params = self._build_request(
+                messages, tools, temperature, max_tokens, raw_messages
+            )
+            request_params["stream"] = True
+
+            # Make API call
+            stream = self.client.chat.completions.create(**request_params)
+
+            for chunk in stream:
+                yield from assembler.feed(chunk)
+
+        except LLMResponseError:
+            raise
+        except Exception as e:
+            self._raise_api_error(e)
+
+        yield from assembler.finish()
+        yield assembler.response()
+
+    async def astream_chat(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> AsyncIterator[str | ToolCall | LLMResponse]:
+        """
+        Stream a chat request to Groq without blocking the event loop.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            raw_messages: Pre-serialized `messages`, sent as-is when given
+
+        Yields:
+            Content fragments and completed ToolCalls as they arrive, then the
+            complete LLMResponse
+        """
+        assembler = _StreamAssembler(self._make_tool_call)
+
+        try:
+            request_params = self._build_request(
+                messages, tools, temperature, max_tokens, raw_messages
+            )
+            request_params["stream"] = True
+
+            # Make API call
+            stream = await self.async_client.chat.completions.create(**request_params)
+
+            async for chunk in stream:
+                for item in assembler.feed(chunk):
+                    yield item
+
+        except LLMResponseError:
+            raise
+        except Exception as e:
+            self._raise_api_error(e)
+
+        for item in assembler.finish():
+            yield item
+        yield assembler.response()
+
+    def _build_request(
+        self,
+        messages: list[Message],
+        tools: list[dict] | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        raw_messages: list[dict[str, Any]] | None = None,
+    ) -> dict:
+        """
+        Build the keyword arguments for a chat completion request.
+
+        Args:
+            messages: Conversation history
+            tools: Available tools
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            raw_messages: Pre-serialized `messages`, sent as-is when given
+
+        Returns:
+            Request parameters for `chat.completions.create`
+        """
+        # Convert messages to API format unless the caller already did
+        if raw_messages is not None:
+            api_messages = raw_messages
+        else:
+            api_messages = [msg.to_dict() for msg in messages]
+
+        # Use lower temperature when tools are provided for more reliable tool calling
+        effective_temperature = temperature or self.default_temperature
+        if tools:
+            effective_temperature = min(effective_temperature, 0.3)
+
+        # Prepare request parameters
+        request_params = {
+            "model": self.model,
+            "messages": api_messages,
+            "temperature": effective_temperature,
+            "max_tokens": max_tokens or self.default_max_tokens,
+        }
+
+        # Add tools if provided
+        if tools:
+            request_params["tools"] = tools
+            request_params["tool_choice"] = "auto"
+            # Let the model batch independent tool calls so the agent can run
+            # them concurrently; malformed batches surface as tool_use_failed
+            request_params["parallel_tool_calls"] = True
+
+        logger.debug(
+            f"Sending request to Groq: {len(api_messages)} messages, "
+            f"{len(tools) if tools else 0} tools"
+        )
+
+        return request_params
+
+    def _raise_api_error(self, error: Exception) -> NoReturn:
+        """
+        Translate a failed Groq API call into an analyzer exception.
+
+        Args:
+            error: Exception raised while calling Groq
+
+        Raises:
+            LLMConnectionError: Always
+        """
+        error_str = str(error)
+        logger.error(f"Groq API call failed: {error_str}")
+
+        # Check for tool_use_failed error - model generated malformed function calls
+        if "tool_use_failed" in error_str:
+            logger.warning(
+                "Model generated malformed function call. "
+                "This can happen with some Llama models. Consider using a different model."
+            )
+            raise LLMConnectionError(
+                "Groq tool calling failed: The model generated an invalid function call format. "
+                "Try using 'llama-3.1-70b-versatile' or 'llama3-70b-8192' instead."
+            )
 
-            raise LLMConnectionError(f"Groq API error: {error_str}")
+        raise LLMConnectionError(f"Groq API error: {error_str}")
 
     def _parse_response(self, response) -> LLMResponse:
         """
@@ -133,16 +346,11 @@ class GroqLLMClient(BaseLLM):
             tool_calls = []
             if hasattr(message, "tool_calls") and message.tool_calls:
                 for tool_call in message.tool_calls:
-                    # Parse function arguments (they come as JSON string)
-                    import json
-
-                    parameters = json.loads(tool_call.function.arguments)
-
                     tool_calls.append(
-                        ToolCall(
-                            id=tool_call.id,
-                            name=tool_call.function.name,
-                            parameters=parameters,
+                        self._make_tool_call(
+                            tool_call.id,
+                            tool_call.function.name,
+                            tool_call.function.arguments,
                         )
                     )
 
@@ -158,13 +366,39 @@ class GroqLLMClient(BaseLLM):
                 content=content,
                 tool_calls=tool_calls,
                 finish_reason=finish_reason,
-                raw_response=response.model_dump() if hasattr(response, "model_dump") else None,
+                # Dumping the whole SDK response is costly and only useful for debugging
+                raw_response=(
+                    response.model_dump()
+                    if self.debug_raw and hasattr(response, "model_dump")
+                    else None
+                ),
             )
 
         except Exception as e:
             logger.error(f"Failed to parse Groq response: {str(e)}")
             raise LLMResponseError(f"Invalid response from Groq: {str(e)}")
 
+    def _make_tool_call(self, call_id: str, name: str, arguments: str) -> ToolCall:
+        """
+        Build a ToolCall from the API's id, function name and argument JSON.
+
+        Args:
+            call_id: Tool call ID
+            name: Tool name
+            arguments: Function arguments as a JSON string
+
+        Returns:
+            Parsed ToolCall
+
+        Raises:
+            ValueError: If the arguments are not a JSON object
+        """
+        parameters = json_loads(arguments)
+        if not isinstance(parameters, dict):
+            raise ValueError(f"Arguments for tool '{name}' are not a JSON object")
+
+        return ToolCall(id=call_id, name=name, parameters=parameters)
+
     def get_model_name(self) -> str:
         """Get model name."""
         return self.model
@@ -179,3 +413,108 @@ class GroqLLMClient(BaseLLM):
 
     def __repr__(self) -> str:
         return f"<GroqLLMClient: {self.model}>"
+
+
+class _StreamAssembler:
+    """
+    Rebuilds an LLMResponse from streamed chat completion chunks.
+
+    Groq streams tool calls one after another, with their argument JSON split
+    across chunks. A call is complete once the next one starts (or the stream
+    ends), so each ToolCall is emitted as soon as it closes rather than after
+    the whole response arrives.
+    """
+
+    def __init__(self, make_tool_call: Callable[[str, str, str], ToolCall]):
+        self._make_tool_call = make_tool_call
+        self._content_parts: list[str] = []
+        # Tool calls being assembled, keyed by their index in the response
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._tool_calls: list[ToolCall] = []
+        self._finish_reason: str | None = None
+
+    def feed(self, chunk: Any) -> Iterator[str | ToolCall]:
+        """
+        Consume one chunk.
+
+        Args:
+            chunk: Streamed chat completion chunk
+
+        Yields:
+            New content fragments and tool calls completed by this chunk
+        """
+        if not chunk.choices:
+            return
+
+        choice = chunk.choices[0]
+        delta = choice.delta
+
+        if delta.content:
+            self._content_parts.append(delta.content)
+            yield delta.content
+
+        for fragment in delta.tool_calls or ():
+            if fragment.index not in self._pending:
+                # A new call starting means every earlier one is complete
+                yield from self._close_pending(before=fragment.index)
+                self._pending[fragment.index] = {"id": None, "name": None, "arguments": []}
+
+            call = self._pending[fragment.index]
+            if fragment.id:
+                call["id"] = fragment.id
+            if fragment.function and fragment.function.name:
+                call["name"] = fragment.function.name
+            if fragment.function and fragment.function.arguments:
+                call["arguments"].append(fragment.function.arguments)
+
+        if choice.finish_reason:
+            self._finish_reason = choice.finish_reason
+
+    def finish(self) -> Iterator[ToolCall]:
+        """
+        Close the stream.
+
+        Yields:
+            Tool calls that were still open
+        """
+        yield from self._close_pending()
+
+        if self._tool_calls:
+            logger.info(f"LLM requested {len(self._tool_calls)} tool call(s)")
+
+    def response(self) -> LLMResponse:
+        """Build the complete response from everything fed so far."""
+        return LLMResponse(
+            content="".join(self._content_parts) if self._content_parts else None,
+            tool_calls=self._tool_calls,
+            finish_reason=self._finish_reason,
+        )
+
+    def _close_pending(self, before: int | None = None) -> Iterator[ToolCall]:
+        """
+        Parse buffered tool calls into ToolCalls.
+
+        Args:
+            before: Only close calls with a lower index; None closes all
+
+        Yields:
+            Completed tool calls, in index order
+
+        Raises:
+            LLMResponseError: If a call's arguments are not valid JSON
+        """
+        for index in sorted(self._pending):
+            if before is not None and index >= before:
+                break
+
+            call = self._pending.pop(index)
+            try:
+                tool_call = self._make_tool_call(
+                    call["id"], call["name"], "".join(call["arguments"]) or "{}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to parse Groq response: {str(e)}")
+                raise LLMResponseError(f"Invalid response from Groq: {str(e)}")
+
+            self._tool_calls.append(tool_call)
+            yield tool_call
@@ -3,12 +3,13 @@ Base class for all tools that the agent can use.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
 
-
-class ToolParameter(BaseModel):
+@dataclass(slots=True)
+class ToolParameter:
     """Definition of a tool parameter."""
 
     name: str
@@ -18,12 +19,13 @@ class ToolParameter(BaseModel):
     default: Any = None
 
 
-class ToolDefinition(BaseModel):
+@dataclass(slots=True)
+class ToolDefinition:
     """Tool definition for LLM function calling."""
 
     name: str
     description: str
-    parameters: dict[str, ToolParameter] = Field(default_factory=dict)
+    parameters: dict[str, ToolParameter] = field(default_factory=dict)
 
     def to_function_schema(self) -> dict[str, Any]:
         """
@@ -112,9 +114,19 @@ class BaseTool(ABC):
             parameters=self.get_parameters(),
         )
 
+    @cached_property
+    def function_schema(self) -> dict[str, Any]:
+        """
+        LLM function calling schema, built once per tool instance.
+
+        Tool definitions are static, so the schema is cached on first access.
+        Treat the returned dict as read-only.
+        """
+        return self.get_definition().to_function_schema()
+
     def to_function_schema(self) -> dict[str, Any]:
         """Convert to LLM function calling schema."""
-        return self.get_definition().to_function_schema()
+        return self.function_schema
 
     def __repr__(self) -> str:
         return f"<Tool: {self.name}>"
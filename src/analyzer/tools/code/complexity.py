@@ -6,8 +6,50 @@ import re
 from pathlib import Path
 
 from analyzer.tools.base import BaseTool, ToolParameter
+from analyzer.tools.registry import ReportCache, SourceFile, read_source
 from analyzer.utils.exceptions import ToolExecutionError
 
+# Patterns are compiled once at import rather than looked up per call
+_METHOD_RE = re.compile(
+    r"(public|private|protected|static|\s)+[\w<>\[\]]+\s+\w+\s*\([^\)]*\)\s*(\{|throws)"
+)
+_CLASS_RE = re.compile(r"\b(class|interface|enum)\s+\w+")
+
+# Decision points for cyclomatic complexity
+_IF_RE = re.compile(r"\bif\s*\(")
+_FOR_RE = re.compile(r"\bfor\s*\(")
+_WHILE_RE = re.compile(r"\bwhile\s*\(")
+_CASE_RE = re.compile(r"\bcase\s+")
+_CATCH_RE = re.compile(r"\bcatch\s*\(")
+_TERNARY_RE = re.compile(r"\?[^:]+:")
+
+# Metrics section of the complexity report, up to the assessment
+_COMPLEXITY_REPORT_TMPL = "\n".join(
+    (
+        "📊 Complexity Analysis Report: {filename}",
+        "=" * 70,
+        "\n📏 Size Metrics:",
+        "   Total Lines:        {total_lines:5d}",
+        "   Code Lines:         {code_lines:5d}",
+        "   Comment Lines:      {comment_lines:5d}",
+        "   Blank Lines:        {blank_lines:5d}",
+        "\n🏗️  Structure:",
+        "   Classes:            {class_count:5d}",
+        "   Methods:            {method_count:5d}",
+        "   Avg Method Length:  {avg_method_length:5d} lines",
+        "\n🔀 Complexity:",
+        "   Cyclomatic Complexity: {cyclomatic_complexity:3d}  {cc_status}",
+        "   Max Nesting Depth:     {max_nesting_depth:3d}  {depth_status}",
+        "",
+        "\n📋 Assessment:",
+    )
+)
+
+# Every byte except braces, deleted before measuring nesting. Braces are
+# ASCII, so they never occur inside a multi-byte UTF-8 sequence.
+_NON_BRACE_BYTES = bytes(b for b in range(256) if b not in b"{}")
+_OPEN_BRACE = ord("{")
+
 
 class ComplexityAnalysisTool(BaseTool):
     """
@@ -18,6 +60,10 @@ class ComplexityAnalysisTool(BaseTool):
     - Lines of code
     """
 
+    def __init__(self) -> None:
+        # Reports for files this tool has analyzed
+        self._reports = ReportCache()
+
     @property
     def name(self) -> str:
         return "complexity_analysis"
@@ -45,101 +91,94 @@ class ComplexityAnalysisTool(BaseTool):
         try:
             path = Path(file_path)
 
-            if not path.exists():
-                raise ToolExecutionError(self.name, f"File not found: {file_path}")
-
-            code = path.read_text(encoding="utf-8")
-            lines = code.split("\n")
-
-            # Calculate metrics
-            metrics = {
-                "total_lines": len(lines),
-                "code_lines": self._count_code_lines(lines),
-                "comment_lines": self._count_comment_lines(lines),
-                "blank_lines": self._count_blank_lines(lines),
-                "method_count": self._count_methods(code),
-                "class_count": self._count_classes(code),
-                "cyclomatic_complexity": self._calculate_cyclomatic_complexity(code),
-                "max_nesting_depth": self._calculate_max_nesting(code),
-            }
-
-            # Calculate derived metrics
-            if metrics["method_count"] > 0:
-                metrics["avg_method_length"] = metrics["code_lines"] // metrics["method_count"]
-            else:
-                metrics["avg_method_length"] = 0
+            try:
+                source = read_source(path)
+            except FileNotFoundError:
+                raise ToolExecutionError(self.name, f"File not found: {file_path}") from None
 
-            return self._format_report(path.name, metrics)
+            # Reuse the report while the file is unchanged
+            report: str = self._reports.get(
+                source, lambda contents: self._analyze(path.name, contents)
+            )
+            return report
 
         except ToolExecutionError:
             raise
         except Exception as e:
             raise ToolExecutionError(self.name, f"Complexity analysis failed: {str(e)}")
 
-    def _count_code_lines(self, lines: list) -> int:
-        """Count non-empty, non-comment lines."""
-        code_lines = 0
-        in_block_comment = False
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Handle block comments
-            if "/*" in stripped:
-                in_block_comment = True
-            if "*/" in stripped:
-                in_block_comment = False
-                continue
+    def _analyze(self, filename: str, source: SourceFile) -> str:
+        """Build a Java file's complexity report."""
+        code, lines = source.text, source.lines
+
+        # Calculate metrics
+        metrics = {
+            "total_lines": len(lines),
+            **self._classify_lines(lines),
+            "method_count": self._count_methods(code),
+            "class_count": self._count_classes(code),
+            "cyclomatic_complexity": self._calculate_cyclomatic_complexity(code),
+            "max_nesting_depth": self._calculate_max_nesting(source.data),
+        }
 
-            if in_block_comment:
-                continue
+        # Calculate derived metrics
+        if metrics["method_count"] > 0:
+            metrics["avg_method_length"] = metrics["code_lines"] // metrics["method_count"]
+        else:
+            metrics["avg_method_length"] = 0
 
-            # Skip empty lines and single-line comments
-            if stripped and not stripped.startswith("//") and not stripped.startswith("*"):
-                code_lines += 1
+        return self._format_report(filename, metrics)
 
-        return code_lines
+    def _classify_lines(self, lines: list[str]) -> dict[str, int]:
+        """
+        Count code, comment and blank lines in a single pass.
 
-    def _count_comment_lines(self, lines: list) -> int:
-        """Count comment lines."""
-        comment_lines = 0
+        Every line falls in exactly one category. Blank lines are blank even
+        inside a block comment, and a line that opens a block comment counts
+        as a comment line.
+        """
+        code_lines = comment_lines = blank_lines = 0
         in_block_comment = False
 
         for line in lines:
             stripped = line.strip()
 
-            if "/*" in stripped:
-                in_block_comment = True
-                comment_lines += 1
+            if not stripped:
+                blank_lines += 1
                 continue
 
+            # Inside a block comment until its closing line
             if in_block_comment:
                 comment_lines += 1
                 if "*/" in stripped:
                     in_block_comment = False
                 continue
 
-            if stripped.startswith("//") or stripped.startswith("*"):
+            if "/*" in stripped:
                 comment_lines += 1
+                in_block_comment = "*/" not in stripped[stripped.index("/*") + 2 :]
+                continue
 
-        return comment_lines
+            # Single-line comments and javadoc continuation lines
+            if stripped.startswith("//") or stripped.startswith("*"):
+                comment_lines += 1
+            else:
+                code_lines += 1
 
-    def _count_blank_lines(self, lines: list) -> int:
-        """Count blank lines."""
-        return sum(1 for line in lines if not line.strip())
+        return {
+            "code_lines": code_lines,
+            "comment_lines": comment_lines,
+            "blank_lines": blank_lines,
+        }
 
     def _count_methods(self, code: str) -> int:
         """Count method definitions."""
         # Match method signatures
-        pattern = (
-            r"(public|private|protected|static|\s)+[\w<>\[\]]+\s+\w+\s*\([^\)]*\)\s*(\{|throws)"
-        )
-        return len(re.findall(pattern, code))
+        return len(_METHOD_RE.findall(code))
 
     def _count_classes(self, code: str) -> int:
         """Count class definitions."""
-        pattern = r"\b(class|interface|enum)\s+\w+"
-        return len(re.findall(pattern, code))
+        return len(_CLASS_RE.findall(code))
 
     def _calculate_cyclomatic_complexity(self, code: str) -> int:
         """
@@ -149,13 +188,14 @@ class ComplexityAnalysisTool(BaseTool):
         Simplified: Count decision points + 1
         """
         # Count decision points
-        if_count = len(re.findall(r"\bif\s*\(", code))
-        for_count = len(re.findall(r"\bfor\s*\(", code))
-        while_count = len(re.findall(r"\bwhile\s*\(", code))
-        case_count = len(re.findall(r"\bcase\s+", code))
-        catch_count = len(re.findall(r"\bcatch\s*\(", code))
-        ternary_count = len(re.findall(r"\?[^:]+:", code))
-        and_or_count = len(re.findall(r"(\&\&|\|\|)", code))
+        if_count = len(_IF_RE.findall(code))
+        for_count = len(_FOR_RE.findall(code))
+        while_count = len(_WHILE_RE.findall(code))
+        case_count = len(_CASE_RE.findall(code))
+        catch_count = len(_CATCH_RE.findall(code))
+        ternary_count = len(_TERNARY_RE.findall(code))
+        # Fixed operators need no regex
+        and_or_count = code.count("&&") + code.count("||")
 
         # Cyclomatic complexity = decision points + 1
         complexity = (
@@ -171,41 +211,25 @@ class ComplexityAnalysisTool(BaseTool):
 
         return complexity
 
-    def _calculate_max_nesting(self, code: str) -> int:
-        """Calculate maximum nesting depth."""
+    def _calculate_max_nesting(self, data: bytes) -> int:
+        """Calculate maximum nesting depth from the file's raw bytes."""
         max_depth = 0
         current_depth = 0
 
-        for char in code:
-            if char == "{":
+        # Only braces matter; deleting everything else in C leaves a small
+        # fraction of the file for the Python loop to walk
+        for byte in data.translate(None, _NON_BRACE_BYTES):
+            if byte == _OPEN_BRACE:
                 current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif char == "}":
-                current_depth = max(0, current_depth - 1)
+                if current_depth > max_depth:
+                    max_depth = current_depth
+            elif current_depth:
+                current_depth -= 1
 
         return max_depth
 
     def _format_report(self, filename: str, metrics: dict) -> str:
         """Format complexity report."""
-        result = []
-        result.append(f"📊 Complexity Analysis Report: {filename}")
-        result.append("=" * 70)
-
-        # Basic metrics
-        result.append("\n📏 Size Metrics:")
-        result.append(f"   Total Lines:        {metrics['total_lines']:5d}")
-        result.append(f"   Code Lines:         {metrics['code_lines']:5d}")
-        result.append(f"   Comment Lines:      {metrics['comment_lines']:5d}")
-        result.append(f"   Blank Lines:        {metrics['blank_lines']:5d}")
-
-        # Structure metrics
-        result.append("\n🏗️  Structure:")
-        result.append(f"   Classes:            {metrics['class_count']:5d}")
-        result.append(f"   Methods:            {metrics['method_count']:5d}")
-        result.append(f"   Avg Method Length:  {metrics['avg_method_length']:5d} lines")
-
-        # Complexity metrics
-        result.append("\n🔀 Complexity:")
         cc = metrics["cyclomatic_complexity"]
 
         if cc <= 10:
@@ -217,8 +241,6 @@ class ComplexityAnalysisTool(BaseTool):
         else:
             cc_status = "🚨 Very High (Critical - refactor immediately)"
 
-        result.append(f"   Cyclomatic Complexity: {cc:3d}  {cc_status}")
-
         depth = metrics["max_nesting_depth"]
 
         if depth <= 3:
@@ -228,13 +250,19 @@ class ComplexityAnalysisTool(BaseTool):
         else:
             depth_status = "🔴 Too deep (refactor to reduce nesting)"
 
-        result.append(f"   Max Nesting Depth:     {depth:3d}  {depth_status}")
-
-        result.append("")
+        # Fixed part of the report, filled in with a single format call
+        result = [
+            _COMPLEXITY_REPORT_TMPL.format_map(
+                {
+                    **metrics,
+                    "filename": filename,
+                    "cc_status": cc_status,
+                    "depth_status": depth_status,
+                }
+            )
+        ]
 
         # Overall assessment
-        result.append("\n📋 Assessment:")
-
         issues = []
         if cc > 20:
             issues.append("High cyclomatic complexity")
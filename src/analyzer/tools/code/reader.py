@@ -5,6 +5,7 @@ Tool for reading Java source files.
 from pathlib import Path
 
 from analyzer.tools.base import BaseTool, ToolParameter
+from analyzer.tools.registry import read_source
 from analyzer.utils.exceptions import ToolExecutionError
 
 
@@ -50,14 +51,6 @@ class ReadFileTool(BaseTool):
         try:
             path = Path(file_path)
 
-            # Validate file exists
-            if not path.exists():
-                raise ToolExecutionError(self.name, f"File not found: {file_path}")
-
-            # Validate it's a file
-            if not path.is_file():
-                raise ToolExecutionError(self.name, f"Path is not a file: {file_path}")
-
             # Validate it's a Java file
             if path.suffix.lower() != ".java":
                 raise ToolExecutionError(
@@ -65,39 +58,42 @@ class ReadFileTool(BaseTool):
                     f"Not a Java file (expected .java extension): {file_path}",
                 )
 
-            # Read the file
-            content = path.read_text(encoding="utf-8")
-
-            # Calculate statistics
-            lines = content.split("\n")
-            total_lines = len(lines)
-            non_empty_lines = len([line for line in lines if line.strip()])
-            comment_lines = len(
-                [
-                    line
-                    for line in lines
-                    if line.strip().startswith("//") or line.strip().startswith("*")
-                ]
-            )
-
-            # Format output for the agent
-            result = []
-            result.append(f"📄 File: {path.name}")
-            result.append(f"📍 Path: {file_path}")
-            result.append("📊 Statistics:")
-            result.append(f"   - Total lines: {total_lines}")
-            result.append(f"   - Non-empty lines: {non_empty_lines}")
-            result.append(f"   - Comment lines: {comment_lines}")
-            result.append(f"   - Code lines (approx): {non_empty_lines - comment_lines}")
-            result.append("")
-            result.append("📝 Contents:")
-            result.append("=" * 70)
-
-            # Add line numbers to content
+            # Read the file, letting the read itself report a missing file or
+            # a directory instead of checking beforehand
+            try:
+                lines = read_source(path).lines
+            except FileNotFoundError:
+                raise ToolExecutionError(self.name, f"File not found: {file_path}") from None
+            except IsADirectoryError:
+                raise ToolExecutionError(self.name, f"Path is not a file: {file_path}") from None
+
+            # Number the lines and gather statistics in a single pass
+            numbered = []
+            non_empty_lines = 0
+            comment_lines = 0
             for i, line in enumerate(lines, 1):
-                result.append(f"{i:4d} | {line}")
+                numbered.append(f"{i:4d} | {line}")
+                stripped = line.strip()
+                if stripped:
+                    non_empty_lines += 1
+                    if stripped.startswith(("//", "*")):
+                        comment_lines += 1
 
-            result.append("=" * 70)
+            # Format output for the agent
+            result = [
+                f"📄 File: {path.name}",
+                f"📍 Path: {file_path}",
+                "📊 Statistics:",
+                f"   - Total lines: {len(lines)}",
+                f"   - Non-empty lines: {non_empty_lines}",
+                f"   - Comment lines: {comment_lines}",
+                f"   - Code lines (approx): {non_empty_lines - comment_lines}",
+                "",
+                "📝 Contents:",
+                "=" * 70,
+                *numbered,
+                "=" * 70,
+            ]
 
             return "\n".join(result)
 
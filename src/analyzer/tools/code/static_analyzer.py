@@ -3,11 +3,65 @@ Tool for performing static analysis on Java code.
 """
 
 import re
+from bisect import bisect_left
+from operator import itemgetter
 from pathlib import Path
 
 from analyzer.tools.base import BaseTool, ToolParameter
+from analyzer.tools.registry import ReportCache, SourceFile, read_source
 from analyzer.utils.exceptions import ToolExecutionError
 
+# Issues found in a file as (line, message) pairs, keyed by severity
+IssueBins = dict[str, list[tuple[int, str]]]
+
+# Severities in report order (most important first), with their icons
+_SEVERITY_ORDER = ["SECURITY", "BUG", "COMPLEXITY", "STYLE", "MAINTENANCE"]
+_SEVERITY_ICONS = {
+    "SECURITY": "🚨",
+    "BUG": "🐛",
+    "COMPLEXITY": "📊",
+    "STYLE": "💅",
+    "MAINTENANCE": "🔧",
+}
+
+# Patterns are compiled once at import rather than looked up per call
+
+# Simple pattern: catch followed by empty braces
+_EMPTY_CATCH_RE = re.compile(r"catch\s*\([^)]+\)\s*\{\s*\}")
+
+# Fixed markers found anywhere in a line, mapped to the issue they raise
+_MARKER_ISSUES = {
+    "System.out.print": ("STYLE", "Using System.out instead of proper logging framework"),
+    "printStackTrace()": ("STYLE", "Using printStackTrace() - use proper logging instead"),
+    "TODO": ("MAINTENANCE", "TODO/FIXME comment - incomplete code"),
+    "FIXME": ("MAINTENANCE", "TODO/FIXME comment - incomplete code"),
+}
+_MARKER_RE = re.compile("|".join(map(re.escape, _MARKER_ISSUES)))
+
+# String literal starting with a SQL statement keyword, concatenated on
+# either side
+_SQL_RE = re.compile(
+    r'"(SELECT|INSERT|UPDATE|DELETE|DROP)\b[^"]*"\s*\+|\+\s*"(SELECT|INSERT|UPDATE|DELETE|DROP)\b'
+)
+
+# Matched against the lowercased line
+_CREDENTIAL_PATTERNS = [
+    (re.compile(r'password\s*=\s*"[^"]+'), "Possible hardcoded password"),
+    (re.compile(r'api_key\s*=\s*"[^"]+'), "Possible hardcoded API key"),
+    (re.compile(r'secret\s*=\s*"[^"]+'), "Possible hardcoded secret"),
+]
+
+# Numeric literals of two or more digits (0, 1, -1 are often okay). Lines
+# without two adjacent digits cannot match, and declarations are exempt.
+_MAGIC_NUMBER_RE = re.compile(r"\b\d{2,}\b")
+_MAGIC_NUMBER_PREFILTER = re.compile(r"\d\d")
+_DECLARATION_RE = re.compile("private|public|final")
+
+# Method signature up to the opening brace of its body
+_METHOD_START_RE = re.compile(r"(public|private|protected)\s+\w+\s+\w+\s*\([^)]*\)\s*\{")
+_BRACE_RE = re.compile(r"[{}]")
+_NEWLINE_RE = re.compile("\n")
+
 
 class StaticAnalysisTool(BaseTool):
     """
@@ -20,6 +74,10 @@ class StaticAnalysisTool(BaseTool):
     - Security issues
     """
 
+    def __init__(self) -> None:
+        # Reports for files this tool has analyzed
+        self._reports = ReportCache()
+
     @property
     def name(self) -> str:
         return "static_analysis"
@@ -48,232 +106,161 @@ class StaticAnalysisTool(BaseTool):
         try:
             path = Path(file_path)
 
-            if not path.exists():
-                raise ToolExecutionError(self.name, f"File not found: {file_path}")
-
-            code = path.read_text(encoding="utf-8")
-            lines = code.split("\n")
-
-            issues = []
-
-            # Check 1: System.out.println usage
-            issues.extend(self._check_system_out(lines))
-
-            # Check 2: Empty catch blocks
-            issues.extend(self._check_empty_catch(code, lines))
+            try:
+                source = read_source(path)
+            except FileNotFoundError:
+                raise ToolExecutionError(self.name, f"File not found: {file_path}") from None
 
-            # Check 3: printStackTrace usage
-            issues.extend(self._check_printstacktrace(lines))
+            # Reuse the report while the file is unchanged
+            report: str = self._reports.get(
+                source, lambda contents: self._analyze(path.name, contents)
+            )
+            return report
 
-            # Check 4: SQL injection risks
-            issues.extend(self._check_sql_injection(lines))
+        except ToolExecutionError:
+            raise
+        except Exception as e:
+            raise ToolExecutionError(self.name, f"Analysis failed: {str(e)}")
 
-            # Check 5: Hardcoded credentials
-            issues.extend(self._check_hardcoded_credentials(lines))
+    def _analyze(self, filename: str, source: SourceFile) -> str:
+        """Build a Java file's static analysis report."""
+        code, lines = source.text, source.lines
 
-            # Check 6: TODO comments
-            issues.extend(self._check_todos(lines))
+        # Offsets of every newline, for mapping match positions to lines
+        newline_offsets = [match.start() for match in _NEWLINE_RE.finditer(code)]
 
-            # Check 7: Magic numbers
-            issues.extend(self._check_magic_numbers(lines))
+        # Each check files its (line, message) issues under their severity
+        bins: IssueBins = {severity: [] for severity in _SEVERITY_ORDER}
 
-            # Check 8: Long methods
-            issues.extend(self._check_long_methods(code))
+        # Line-by-line checks: System.out, printStackTrace, SQL injection,
+        # hardcoded credentials, TODO comments and magic numbers
+        self._scan_lines(lines, bins)
 
-            # Format output
-            return self._format_report(path.name, issues)
+        # Empty catch blocks
+        self._check_empty_catch(code, newline_offsets, bins)
 
-        except ToolExecutionError:
-            raise
-        except Exception as e:
-            raise ToolExecutionError(self.name, f"Analysis failed: {str(e)}")
+        # Long methods
+        self._check_long_methods(code, newline_offsets, bins)
 
-    def _check_system_out(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for System.out usage."""
-        issues = []
-        for i, line in enumerate(lines, 1):
-            if "System.out.println" in line or "System.out.print" in line:
-                issues.append(
-                    (
-                        "STYLE",
-                        i,
-                        "Using System.out instead of proper logging framework",
-                    )
-                )
-        return issues
+        # Format output
+        return self._format_report(filename, bins)
 
-    def _check_empty_catch(self, code: str, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for empty catch blocks."""
-        issues = []
-        # Simple pattern: catch followed by empty braces
-        pattern = r"catch\s*\([^)]+\)\s*\{\s*\}"
-        for match in re.finditer(pattern, code):
-            line_num = code[: match.start()].count("\n") + 1
-            issues.append(("BUG", line_num, "Empty catch block - exceptions should be handled"))
-        return issues
-
-    def _check_printstacktrace(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for printStackTrace usage."""
-        issues = []
+    def _scan_lines(self, lines: list[str], bins: IssueBins) -> None:
+        """Run every line-based check in a single pass over the file."""
+        security = bins["SECURITY"]
+        style = bins["STYLE"]
         for i, line in enumerate(lines, 1):
-            if "printStackTrace()" in line:
-                issues.append(
+            # System.out, printStackTrace and TODO/FIXME, found in one search;
+            # each kind of issue is reported once per line
+            markers = _MARKER_RE.findall(line)
+            if markers:
+                for severity, message in dict.fromkeys(_MARKER_ISSUES[m] for m in markers):
+                    bins[severity].append((i, message))
+
+            # SQL injection: string concatenation with SQL keywords
+            if "+" in line and (sql := _SQL_RE.search(line)):
+                keyword = sql.group(1) or sql.group(2)
+                security.append(
                     (
-                        "STYLE",
                         i,
-                        "Using printStackTrace() - use proper logging instead",
+                        f"Potential SQL injection - {keyword} statement with string concatenation",
                     )
                 )
-        return issues
-
-    def _check_sql_injection(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for potential SQL injection vulnerabilities."""
-        issues = []
-        sql_keywords = ["SELECT", "INSERT", "UPDATE", "DELETE", "DROP"]
 
-        for i, line in enumerate(lines, 1):
-            # Check for string concatenation with SQL keywords
-            for keyword in sql_keywords:
-                if f'"{keyword}' in line and "+" in line:
-                    issues.append(
-                        (
-                            "SECURITY",
-                            i,
-                            f"Potential SQL injection - {keyword} statement with string concatenation",
-                        )
-                    )
-                    break
-        return issues
-
-    def _check_hardcoded_credentials(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for hardcoded passwords or API keys."""
-        issues = []
-        patterns = [
-            (r'password\s*=\s*"[^"]+', "Possible hardcoded password"),
-            (r'api_key\s*=\s*"[^"]+', "Possible hardcoded API key"),
-            (r'secret\s*=\s*"[^"]+', "Possible hardcoded secret"),
-        ]
-
-        for i, line in enumerate(lines, 1):
+            # Hardcoded passwords or API keys
             line_lower = line.lower()
-            for pattern, message in patterns:
-                if re.search(pattern, line_lower):
-                    issues.append(("SECURITY", i, message))
+            for pattern, message in _CREDENTIAL_PATTERNS:
+                if pattern.search(line_lower):
+                    security.append((i, message))
                     break
-        return issues
 
-    def _check_todos(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for TODO comments."""
-        issues = []
-        for i, line in enumerate(lines, 1):
-            if "TODO" in line or "FIXME" in line:
-                issues.append(("MAINTENANCE", i, "TODO/FIXME comment - incomplete code"))
-        return issues
-
-    def _check_magic_numbers(self, lines: list[str]) -> list[tuple[str, int, str]]:
-        """Check for magic numbers."""
-        issues = []
-        # Look for numeric literals (excluding 0, 1, -1 which are often okay)
-        pattern = r"\b\d{2,}\b"
-
-        for i, line in enumerate(lines, 1):
-            # Skip comments and strings
-            if line.strip().startswith("//") or line.strip().startswith("*"):
+            # Magic numbers, skipping comments and declarations. Most lines have
+            # no two adjacent digits at all, so test for that first.
+            if not _MAGIC_NUMBER_PREFILTER.search(line):
+                continue
+            if line.strip().startswith(("//", "*")) or _DECLARATION_RE.search(line):
                 continue
 
-            matches = re.findall(pattern, line)
-            if matches and not any(x in line for x in ["private", "public", "final"]):
-                issues.append(
+            matches = _MAGIC_NUMBER_RE.findall(line)
+            if matches:
+                style.append(
                     (
-                        "STYLE",
                         i,
                         f"Magic number(s) detected: {', '.join(matches)} - consider using named constants",
                     )
                 )
-        return issues
 
-    def _check_long_methods(self, code: str) -> list[tuple[str, int, str]]:
+    def _check_empty_catch(self, code: str, newline_offsets: list[int], bins: IssueBins) -> None:
+        """Check for empty catch blocks."""
+        for match in _EMPTY_CATCH_RE.finditer(code):
+            line_num = bisect_left(newline_offsets, match.start()) + 1
+            bins["BUG"].append((line_num, "Empty catch block - exceptions should be handled"))
+
+    def _check_long_methods(self, code: str, newline_offsets: list[int], bins: IssueBins) -> None:
         """Check for methods that are too long."""
-        issues = []
         # Simple heuristic: method followed by lots of lines before closing brace
-        method_pattern = r"(public|private|protected)\s+\w+\s+\w+\s*\([^)]*\)\s*\{"
-
-        for match in re.finditer(method_pattern, code):
-            start_line = code[: match.start()].count("\n") + 1
+        for match in _METHOD_START_RE.finditer(code):
+            start_line = bisect_left(newline_offsets, match.start()) + 1
             # Count lines until matching closing brace (simplified)
-            remaining = code[match.end() :]
-            brace_count = 1
-            lines_in_method = 0
-
-            for char in remaining:
-                if char == "\n":
-                    lines_in_method += 1
-                elif char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        break
+            body_end = self._find_block_end(code, match.end())
+            lines_in_method = code.count("\n", match.end(), body_end)
 
             if lines_in_method > 50:
-                issues.append(
+                bins["COMPLEXITY"].append(
                     (
-                        "COMPLEXITY",
                         start_line,
                         f"Method is too long ({lines_in_method} lines) - consider refactoring",
                     )
                 )
 
-        return issues
-
-    def _format_report(self, filename: str, issues: list[tuple[str, int, str]]) -> str:
+    def _find_block_end(self, code: str, start: int) -> int:
+        """
+        Find the closing brace of a block whose opening brace ends at `start`.
+
+        Only brace positions are visited, so the scan skips over everything
+        else in the body.
+
+        Returns:
+            Offset of the closing brace, or the end of the code if the block
+            is never closed
+        """
+        depth = 1
+        for brace in _BRACE_RE.finditer(code, start):
+            if brace.group() == "{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return brace.start()
+        return len(code)
+
+    def _format_report(self, filename: str, bins: IssueBins) -> str:
         """Format the analysis report."""
-        result = []
-        result.append(f"🔍 Static Analysis Report: {filename}")
-        result.append("=" * 70)
+        result = [f"🔍 Static Analysis Report: {filename}", "=" * 70]
 
-        if not issues:
+        if not any(bins.values()):
             result.append("✅ No issues found! Code looks clean.")
             return "\n".join(result)
 
-        # Group by severity
-        by_severity = {
-            "SECURITY": [],
-            "BUG": [],
-            "COMPLEXITY": [],
-            "STYLE": [],
-            "MAINTENANCE": [],
-        }
-
-        for severity, line, message in issues:
-            by_severity[severity].append((line, message))
-
         # Print by severity (most important first)
-        severity_order = ["SECURITY", "BUG", "COMPLEXITY", "STYLE", "MAINTENANCE"]
-        severity_icons = {
-            "SECURITY": "🚨",
-            "BUG": "🐛",
-            "COMPLEXITY": "📊",
-            "STYLE": "💅",
-            "MAINTENANCE": "🔧",
-        }
-
         total_issues = 0
-        for severity in severity_order:
-            issues_list = by_severity[severity]
+        for severity in _SEVERITY_ORDER:
+            issues_list = bins[severity]
             if issues_list:
-                result.append(f"\n{severity_icons[severity]} {severity} Issues:")
-                for line, message in sorted(issues_list):
-                    result.append(f"   Line {line:4d}: {message}")
-                    total_issues += 1
+                result.append(f"\n{_SEVERITY_ICONS[severity]} {severity} Issues:")
+                # By line only; issues on the same line keep the order found
+                result.extend(
+                    f"   Line {line:4d}: {message}"
+                    for line, message in sorted(issues_list, key=itemgetter(0))
+                )
+                total_issues += len(issues_list)
 
-        result.append("\n" + "=" * 70)
-        result.append(f"Total issues found: {total_issues}")
+        result.extend(("\n" + "=" * 70, f"Total issues found: {total_issues}"))
 
         # Provide priority recommendation
-        if by_severity["SECURITY"]:
+        if bins["SECURITY"]:
             result.append("\n⚠️  PRIORITY: Address security issues immediately!")
-        elif by_severity["BUG"]:
+        elif bins["BUG"]:
             result.append("\n⚠️  PRIORITY: Fix potential bugs before deploying!")
 
         return "\n".join(result)
@@ -2,6 +2,11 @@
 Tool registry - manages all available tools for the agent.
 """
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
 
 from loguru import logger
 
@@ -19,8 +24,12 @@ class ToolRegistry:
     - Execute tools by name
     """
 
+    __slots__ = ("_tools", "_schemas_cache")
+
     def __init__(self):
         self._tools: dict[str, BaseTool] = {}
+        # Built on first request, cleared whenever the tool set changes
+        self._schemas_cache: list[dict] | None = None
         logger.info("Tool registry initialized")
 
     def register(self, tool: BaseTool) -> None:
@@ -34,6 +43,7 @@ class ToolRegistry:
             logger.warning(f"Tool '{tool.name}' already registered, overwriting")
 
         self._tools[tool.name] = tool
+        self._schemas_cache = None
         logger.info(f"Registered tool: {tool.name}")
 
     def unregister(self, tool_name: str) -> None:
@@ -45,6 +55,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._schemas_cache = None
             logger.info(f"Unregistered tool: {tool_name}")
 
     def get_tool(self, tool_name: str) -> BaseTool:
@@ -60,11 +71,14 @@ class ToolRegistry:
         Raises:
             ToolNotFoundError: If tool doesn't exist
         """
-        if tool_name not in self._tools:
+        # A single lookup on the hot path; missing tools are the rare case
+        try:
+            return self._tools[tool_name]
+        except KeyError:
             available = ", ".join(self._tools.keys())
-            raise ToolNotFoundError(f"Tool '{tool_name}' not found. Available tools: {available}")
-
-        return self._tools[tool_name]
+            raise ToolNotFoundError(
+                f"Tool '{tool_name}' not found. Available tools: {available}"
+            ) from None
 
     def has_tool(self, tool_name: str) -> bool:
         """Check if a tool is registered."""
@@ -82,10 +96,15 @@ class ToolRegistry:
         """
         Get function schemas for all tools (for LLM).
 
+        The list is cached until a tool is registered or unregistered and is
+        shared between callers, so it must not be modified.
+
         Returns:
             List of tool schemas in OpenAI/Groq function calling format
         """
-        return [tool.to_function_schema() for tool in self._tools.values()]
+        if self._schemas_cache is None:
+            self._schemas_cache = [tool.to_function_schema() for tool in self._tools.values()]
+        return self._schemas_cache
 
     def execute_tool(self, tool_name: str, **parameters) -> str:
         """
@@ -103,12 +122,15 @@ class ToolRegistry:
             ToolExecutionError: If tool execution fails
         """
         tool = self.get_tool(tool_name)
-        logger.info(f"Executing tool: {tool_name} with params: {parameters}")
+
+        # Runs on every agent step: arguments are passed separately so loguru
+        # only formats the message when a sink accepts it
+        logger.debug("Executing tool: {} with params: {}", tool_name, parameters)
 
         result = tool.execute(**parameters)
 
         logger.debug(
-            f"Tool '{tool_name}' executed successfully, " f"result length: {len(result)} chars"
+            "Tool '{}' executed successfully, result length: {} chars", tool_name, len(result)
         )
 
         return result
@@ -149,6 +171,114 @@ def get_registry() -> ToolRegistry:
     return _global_registry
 
 
+@dataclass(frozen=True, slots=True)
+class SourceFile:
+    """Contents of a source file, shared read-only between tools."""
+
+    data: bytes  # Raw UTF-8 bytes, for scans that only look at ASCII
+    text: str
+    lines: list[str]  # Without line endings
+    key: tuple[str, int, int]  # (path, mtime_ns, size) when the file was read
+
+
+# Source files read by the code tools, shared so that running several tools
+# on one file reads and decodes it once. Keyed by (path, mtime_ns, size) so an
+# edited file is read again; least recently used entries are evicted.
+_FILE_CACHE_SIZE = 32
+_file_cache: OrderedDict[tuple[str, int, int], SourceFile] = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def read_source(path: Path) -> SourceFile:
+    """
+    Read a UTF-8 source file through the shared file cache.
+
+    Args:
+        path: File to read
+
+    Returns:
+        The file's contents. They are shared between callers and must not
+        be modified.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+        if cached is not None:
+            _file_cache.move_to_end(key)
+            return cached
+
+    # Decoded once; byte-level scans use `data` without re-encoding
+    data = path.read_bytes()
+    text = data.decode("utf-8")
+    source = SourceFile(data=data, text=text, lines=_split_lines(text), key=key)
+
+    with _file_cache_lock:
+        _file_cache[key] = source
+        if len(_file_cache) > _FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+
+    return source
+
+
+class ReportCache:
+    """
+    Reports built from source files, reused while a file is unchanged.
+
+    Keyed by the `SourceFile.key` of the contents a report was built from,
+    so the report always matches the stat taken when the file was read.
+    Each tool keeps its own cache; least recently used reports are evicted.
+    """
+
+    __slots__ = ("_reports", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._reports: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def get(self, source: SourceFile, build: Callable[[SourceFile], str]) -> str:
+        """
+        Get the report for a source file, building it if needed.
+
+        Args:
+            source: File contents from `read_source`
+            build: Builds the report from the contents
+
+        Returns:
+            The cached or newly built report
+        """
+        with self._lock:
+            report = self._reports.get(source.key)
+            if report is not None:
+                self._reports.move_to_end(source.key)
+                return report
+
+        report = build(source)
+
+        with self._lock:
+            self._reports[source.key] = report
+            if len(self._reports) > self._maxsize:
+                self._reports.popitem(last=False)
+
+        return report
+
+
+def _split_lines(text: str) -> list[str]:
+    """
+    Split source text into lines the way javac and editors count them.
+
+    Only "\n" ends a line (a trailing "\r" is dropped), unlike
+    `str.splitlines`, which also breaks on form feeds and other separators
+    and would disagree with line numbers computed from "\n" offsets.
+    """
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+
 def register_default_tools() -> ToolRegistry:
     """
     Register all default tools.
@@ -42,6 +42,9 @@ class ToolNotFoundError(ToolError):
 class ToolExecutionError(ToolError):
     """Tool execution failed."""
 
+    # Keeps the instance __dict__ from being created
+    __slots__ = ("tool_name",)
+
     def __init__(self, tool_name: str, message: str):
         self.tool_name = tool_name
         super().__init__(f"Tool '{tool_name}' failed: {message}")
@@ -68,6 +71,9 @@ class ConfigurationError(AnalyzerError):
 class FileAnalysisError(AnalyzerError):
     """Error analyzing a file."""
 
+    # Keeps the instance __dict__ from being created
+    __slots__ = ("file_path",)
+
     def __init__(self, file_path: str, message: str):
         self.file_path = file_path
         super().__init__(f"Failed to analyze '{file_path}': {message}")
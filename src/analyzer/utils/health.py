@@ -2,49 +2,155 @@
 Health check utilities to verify system setup and readiness.
 """
 
+import asyncio
+import errno
+import os
+import stat
 import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from config.settings import settings
+from config.settings import get_settings
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    """Worker threads for `HealthCheck.run_all_checks`, created on first use."""
+    return ThreadPoolExecutor(
+        max_workers=len(HealthCheck.CHECKS), thread_name_prefix="health-check"
+    )
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Console for health check output, created on first use."""
+    return Console()
+
+
+# The interpreter cannot change while the process runs, so its version
+# check is settled at import
+_PY_VERSION_STR = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_PY_OK = sys.version_info >= (3, 11)
+_PY_VERSION_MESSAGE = (
+    f"✓ Python {_PY_VERSION_STR}"
+    if _PY_OK
+    else f"✗ Python {sys.version_info.major}.{sys.version_info.minor} (requires 3.11+)"
+)
+
+# Prefix of every Groq API key
+_GSK_PREFIX = "gsk_"
+
+_HEADER = "\n[bold cyan]🏥 Running System Health Checks...[/bold cyan]\n"
+
+# Status column of the results table, by whether the check passed
+_STATUS_CELLS = {True: "[green]✓ PASS[/green]", False: "[red]✗ FAIL[/red]"}
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """Result of a single health check."""
+
+    name: str
+    passed: bool
+    message: str = ""
+
+
+# Outcomes of recent checks as (timestamp, passed, results), keyed by check name
+_HEALTH_CACHE: dict[str, tuple[float, bool, list[CheckResult]]] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Latest finished run of `quick_check` or `run_health_check`, with when it
+# finished; guarded by _CACHE_LOCK
+_latest: "HealthCheck | None" = None
+_latest_ts = 0.0
+
+
+def _cached(
+    name: str, ttl: float, fn: Callable[[], tuple[bool, list[CheckResult]]]
+) -> tuple[bool, list[CheckResult]]:
+    """
+    Return the outcome of a check, reusing one computed within `ttl` seconds.
+
+    Checks that raise are not cached, so they are retried on the next call.
+
+    Args:
+        name: Check name, used as the cache key
+        ttl: Maximum age in seconds of a reusable outcome
+        fn: Runs the check, returning (passed, check results)
+
+    Returns:
+        Tuple of (passed, check results)
+    """
+    with _CACHE_LOCK:
+        cached = _HEALTH_CACHE.get(name)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1], cached[2]
+
+    passed, results = fn()
+    with _CACHE_LOCK:
+        _HEALTH_CACHE[name] = (time.monotonic(), passed, results)
+    return passed, results
 
 
 class HealthCheck:
     """System health checker."""
 
+    # Checks run by `run_all_checks`, in the order their results are reported
+    CHECKS = (
+        "check_python_version",
+        "check_dependencies",
+        "check_settings_load",
+        "check_environment_variables",
+        "check_directories",
+        "check_write_permissions",
+        "check_llm_connectivity",
+    )
+
+    # Name shown for a check that crashed or was skipped, matching the
+    # names its results are reported under
+    CHECK_NAMES = {
+        "check_python_version": "Python Version",
+        "check_dependencies": "Dependencies",
+        "check_settings_load": "Settings",
+        "check_environment_variables": "Environment",
+        "check_directories": "Directories",
+        "check_write_permissions": "Write Permissions",
+        "check_llm_connectivity": "LLM API Key",
+    }
+
     def __init__(self):
-        self.checks: list[tuple[str, bool, str]] = []
+        self.checks: list[CheckResult] = []
+        # Whether each probed path is a directory, stat'ed once per path
+        self._dir_stats: dict[Path, bool] = {}
 
     def add_check(self, name: str, passed: bool, message: str = "") -> None:
         """Add a check result."""
-        self.checks.append((name, passed, message))
+        self.checks.append(CheckResult(name, passed, message))
+
+    @property
+    def failed(self) -> int:
+        """Number of recorded checks that did not pass."""
+        return sum(not result.passed for result in self.checks)
 
     def check_python_version(self) -> bool:
         """Check if Python version is compatible."""
-        version = sys.version_info
-        required = (3, 11)
-
-        if version >= required:
-            self.add_check(
-                "Python Version",
-                True,
-                f"✓ Python {version.major}.{version.minor}.{version.micro}",
-            )
-            return True
-        else:
-            self.add_check(
-                "Python Version",
-                False,
-                f"✗ Python {version.major}.{version.minor} (requires 3.11+)",
-            )
-            return False
+        self.add_check("Python Version", _PY_OK, _PY_VERSION_MESSAGE)
+        return _PY_OK
 
     def check_environment_variables(self) -> bool:
         """Check if required environment variables are set."""
+        settings = get_settings()
         checks = []
 
         # Check primary LLM API key
@@ -73,6 +179,7 @@ class HealthCheck:
 
     def check_directories(self) -> bool:
         """Check if required directories exist."""
+        settings = get_settings()
         directories = [
             ("data/memory", settings.memory_dir),
             ("data/logs", settings.log_dir),
@@ -81,9 +188,11 @@ class HealthCheck:
             ("config/prompts", settings.prompts_dir),
         ]
 
+        probes = self._probe_dirs([path for _, path in directories])
+
         all_exist = True
         for name, path in directories:
-            exists = path.exists() and path.is_dir()
+            exists, _ = probes[path]
             all_exist = all_exist and exists
             status = "✓ Exists" if exists else "✗ Missing"
             self.add_check(f"Directory: {name}", exists, status)
@@ -103,10 +212,10 @@ class HealthCheck:
 
         all_installed = True
         for package, description in dependencies:
-            try:
-                __import__(package)
+            # Locate the package without importing (and initializing) it
+            if find_spec(package) is not None:
                 self.add_check(f"Package: {package}", True, f"✓ {description}")
-            except ImportError:
+            else:
                 self.add_check(f"Package: {package}", False, f"✗ {description}")
                 all_installed = False
 
@@ -115,6 +224,7 @@ class HealthCheck:
     def check_settings_load(self) -> bool:
         """Check if settings load correctly."""
         try:
+            settings = get_settings()
             _ = settings.primary_llm
             _ = settings.max_iterations
             _ = settings.environment
@@ -126,104 +236,342 @@ class HealthCheck:
 
     def check_llm_connectivity(self) -> bool:
         """Check if we can potentially connect to LLM (basic check)."""
-        if settings.primary_llm == "groq":
-            if settings.groq_api_key and settings.groq_api_key.startswith("gsk_"):
+        settings = get_settings()
+        primary_llm = settings.primary_llm
+        if primary_llm == "groq":
+            key = settings.groq_api_key
+            if len(key) >= len(_GSK_PREFIX) and key.startswith(_GSK_PREFIX):
                 self.add_check("LLM API Key", True, "✓ Key format valid")
                 return True
             else:
                 self.add_check("LLM API Key", False, "✗ Invalid key format")
                 return False
-        elif settings.primary_llm == "ollama":
+        elif primary_llm == "ollama":
             self.add_check("LLM", True, f"✓ Local Ollama ({settings.ollama_base_url})")
             return True
         else:
-            self.add_check("LLM", True, f"✓ Using {settings.primary_llm}")
+            self.add_check("LLM", True, f"✓ Using {primary_llm}")
             return True
 
     def check_write_permissions(self) -> bool:
         """Check if we have write permissions to data directories."""
+        settings = get_settings()
         test_dirs = [settings.log_dir, settings.cache_dir, settings.memory_dir]
 
+        probes = self._probe_dirs(test_dirs, write=True)
+
         all_writable = True
         for directory in test_dirs:
-            test_file = directory / ".write_test"
-            try:
-                test_file.write_text("test")
-                test_file.unlink()
+            _, error = probes[directory]
+            if error is None:
                 self.add_check(f"Write: {directory.name}", True, "✓ Writable")
-            except Exception as e:
-                self.add_check(f"Write: {directory.name}", False, f"✗ {str(e)}")
+            else:
+                self.add_check(f"Write: {directory.name}", False, f"✗ {error}")
                 all_writable = False
 
         return all_writable
 
-    def run_all_checks(self) -> bool:
-        """Run all health checks."""
-        console.print("\n[bold cyan]🏥 Running System Health Checks...[/bold cyan]\n")
-
-        results = [
-            self.check_python_version(),
-            self.check_dependencies(),
-            self.check_settings_load(),
-            self.check_environment_variables(),
-            self.check_directories(),
-            self.check_write_permissions(),
-            self.check_llm_connectivity(),
-        ]
+    def _probe_dirs(
+        self, paths: list[Path], write: bool = False
+    ) -> dict[Path, tuple[bool, str | None]]:
+        """
+        Probe directories, stat'ing each path only once.
+
+        Stat results are cached so `check_directories` and
+        `check_write_permissions` share them.
+
+        Args:
+            paths: Directories to probe
+            write: Also check that files can be created in them
+
+        Returns:
+            Mapping of path to (is a directory, write error or None)
+        """
+        probes = {}
+        for path in paths:
+            is_dir = self._dir_stats.get(path)
+            if is_dir is None:
+                is_dir = self._dir_stats[path] = self._is_dir(path)
+
+            error = None
+            if write:
+                error = self._write_error(path) if is_dir else f"Not a directory: {path}"
+            probes[path] = (is_dir, error)
+        return probes
+
+    @staticmethod
+    def _is_dir(path: Path) -> bool:
+        """Check that a path is a directory with a single stat call."""
+        try:
+            return stat.S_ISDIR(os.stat(path).st_mode)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_error(directory: Path) -> str | None:
+        """
+        Check that a file can be created in a directory.
+
+        Uses an unnamed O_TMPFILE file where the platform supports it, which
+        never appears in the directory and needs no cleanup; otherwise
+        creates and removes a uniquely named temporary file, so concurrent
+        checks never collide.
+
+        Returns:
+            None if writable, else the error message
+        """
+        o_tmpfile = getattr(os, "O_TMPFILE", None)
+        if o_tmpfile is not None:
+            try:
+                os.close(os.open(directory, os.O_WRONLY | o_tmpfile, 0o600))
+                return None
+            except OSError as e:
+                # Anything but "not supported here" is a real answer
+                if e.errno not in (errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL):
+                    return str(e)
+
+        try:
+            fd, test_file = tempfile.mkstemp(dir=directory)
+            os.close(fd)
+            os.unlink(test_file)
+            return None
+        except Exception as e:
+            return str(e)
+
+    def run_all_checks(self, force: bool = False, fail_fast: bool = False) -> bool:
+        """
+        Run all health checks concurrently.
+
+        Checks block on imports and filesystem access, so each runs in a
+        worker thread against its own HealthCheck. Results are then added
+        here in `CHECKS` order, whatever order the checks finish in. No
+        event loop is involved, so this is safe to call from async code;
+        `run_all_checks_async` avoids blocking the loop there.
+
+        Outcomes are reused for the `health_cache_ttl_seconds` setting, so
+        repeated calls (e.g. readiness probes) do not redo every check.
+
+        With `fail_fast`, checks instead run one at a time in `CHECKS` order.
+        The first failure stops the run, and the remaining checks are
+        recorded as skipped.
+
+        Args:
+            force: Re-run every check instead of reusing recent outcomes
+            fail_fast: Stop at the first failing check
+
+        Returns:
+            True if every check passed
+        """
+        _console().print(_HEADER)
+        ttl = self._cache_ttl(force)
+
+        outcome: tuple[bool, list[CheckResult]] | BaseException
+        if fail_fast:
+            for i, check in enumerate(self.CHECKS):
+                try:
+                    outcome = self._run_isolated(check, ttl)
+                except Exception as e:
+                    outcome = e
+
+                if not self._record_outcome(check, outcome):
+                    self._skip_after(i)
+                    return False
+            return True
+
+        futures = [_executor().submit(self._run_isolated, check, ttl) for check in self.CHECKS]
+
+        all_passed = True
+        for check, future in zip(self.CHECKS, futures, strict=True):
+            outcome = future.exception() or future.result()
+            all_passed = self._record_outcome(check, outcome) and all_passed
+
+        return all_passed
+
+    async def run_all_checks_async(self, force: bool = False, fail_fast: bool = False) -> bool:
+        """
+        Run all health checks without blocking the event loop.
+
+        Behaves like `run_all_checks`, with the checks running in the
+        loop's default executor.
+
+        Args:
+            force: Re-run every check instead of reusing recent outcomes
+            fail_fast: Stop at the first failing check
+
+        Returns:
+            True if every check passed
+        """
+        _console().print(_HEADER)
+        ttl = self._cache_ttl(force)
+
+        outcome: tuple[bool, list[CheckResult]] | BaseException
+        if fail_fast:
+            for i, check in enumerate(self.CHECKS):
+                try:
+                    outcome = await asyncio.to_thread(self._run_isolated, check, ttl)
+                except Exception as e:
+                    outcome = e
+
+                if not self._record_outcome(check, outcome):
+                    self._skip_after(i)
+                    return False
+            return True
+
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(self._run_isolated, check, ttl) for check in self.CHECKS),
+            return_exceptions=True,
+        )
 
-        return all(results)
+        all_passed = True
+        for check, outcome in zip(self.CHECKS, outcomes, strict=True):
+            all_passed = self._record_outcome(check, outcome) and all_passed
+
+        return all_passed
+
+    def _skip_after(self, index: int) -> None:
+        """Record every check after `CHECKS[index]` as skipped."""
+        for skipped in self.CHECKS[index + 1 :]:
+            self.add_check(self.CHECK_NAMES[skipped], False, "- Skipped: an earlier check failed")
+
+    def _record_outcome(
+        self, check: str, outcome: tuple[bool, list[CheckResult]] | BaseException
+    ) -> bool:
+        """
+        Add the results of one check run by `_run_isolated`.
+
+        Args:
+            check: Name of the check method
+            outcome: What `_run_isolated` returned, or the exception it raised
+
+        Returns:
+            True if the check passed
+        """
+        # A check that crashed counts as failed instead of aborting the rest;
+        # cancellation and interrupts are not check failures and propagate
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            self.add_check(self.CHECK_NAMES[check], False, f"✗ Error: {str(outcome)}")
+            return False
+
+        passed, results = outcome
+        for result in results:
+            self.add_check(result.name, result.passed, result.message)
+        return passed
+
+    @staticmethod
+    def _cache_ttl(force: bool) -> float:
+        """
+        How long check outcomes may be reused for in this run.
+
+        Health checks must work when settings do not load, since diagnosing
+        that is their job, so a broken configuration disables reuse rather
+        than failing every check.
+        """
+        if force:
+            return 0
+        try:
+            ttl: float = get_settings().health_cache_ttl_seconds
+        except Exception:
+            # `check_settings_load` reports why
+            return 0
+        return ttl
+
+    def _run_isolated(self, check: str, ttl: float = 0) -> tuple[bool, list[CheckResult]]:
+        """
+        Run one check against a fresh HealthCheck.
+
+        Args:
+            check: Name of the check method
+            ttl: Maximum age in seconds of a reusable outcome; 0 always
+                re-runs the check
+
+        Returns:
+            Tuple of (passed, check results recorded by the check)
+        """
+
+        def run() -> tuple[bool, list[CheckResult]]:
+            probe = type(self)()
+            # Let checks that probe the same directories share the results
+            probe._dir_stats = self._dir_stats
+            passed = getattr(probe, check)()
+            return passed, probe.checks
+
+        return _cached(check, ttl, run)
 
     def print_results(self) -> None:
-        """Print health check results in a beautiful table."""
+        """
+        Print health check results in a beautiful table.
+
+        When output is not a terminal (piped, or captured by pytest) the
+        results are written as plain tab-separated lines instead, skipping
+        Rich's layout pass.
+        """
+        console = _console()
+        failed = self.failed
+        total = len(self.checks)
+
+        if failed == 0:
+            summary = f"✅ All {total} checks passed! System is ready."
+        else:
+            summary = f"❌ {failed}/{total} checks failed. Please fix the issues above."
+
+        if not console.is_terminal:
+            lines = [
+                f"{result.name}\t{'PASS' if result.passed else 'FAIL'}\t{result.message}"
+                for result in self.checks
+            ]
+            lines.append(summary)
+            console.file.write("\n".join(lines) + "\n")
+            return
+
         table = Table(title="Health Check Results", show_header=True, header_style="bold magenta")
         table.add_column("Check", style="cyan", width=30)
         table.add_column("Status", width=10)
         table.add_column("Details", style="dim")
 
-        for name, passed, message in self.checks:
-            status = "[green]✓ PASS[/green]" if passed else "[red]✗ FAIL[/red]"
-            table.add_row(name, status, message)
+        for result in self.checks:
+            table.add_row(result.name, _STATUS_CELLS[result.passed], result.message)
 
         console.print(table)
 
         # Summary
-        total = len(self.checks)
-        passed = sum(1 for _, p, _ in self.checks if p)
-        failed = total - passed
-
-        if failed == 0:
-            console.print(
-                Panel(
-                    f"[bold green]✅ All {total} checks passed! System is ready.[/bold green]",
-                    title="Status",
-                    border_style="green",
-                )
-            )
-        else:
-            console.print(
-                Panel(
-                    f"[bold red]❌ {failed}/{total} checks failed. Please fix the issues above.[/bold red]",
-                    title="Status",
-                    border_style="red",
-                )
+        color = "green" if failed == 0 else "red"
+        console.print(
+            Panel(
+                f"[bold {color}]{summary}[/bold {color}]",
+                title="Status",
+                border_style=color,
             )
+        )
 
     def get_system_info(self) -> dict[str, str]:
         """Get system information."""
-        return {
-            "Python Version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            "Platform": sys.platform,
-            "Environment": settings.environment,
-            "Primary LLM": settings.primary_llm,
-            "Log Level": settings.log_level,
-            "Max Iterations": str(settings.max_iterations),
-            "Memory Enabled": str(settings.enable_memory),
-        }
+        try:
+            # A copy, so callers cannot change the cached values
+            return dict(_system_info())
+        except Exception:
+            # Settings failed to load; `check_settings_load` reports why
+            return {
+                "Python Version": _PY_VERSION_STR,
+                "Platform": sys.platform,
+                **dict.fromkeys(
+                    ("Environment", "Primary LLM", "Log Level", "Max Iterations", "Memory Enabled"),
+                    "unavailable",
+                ),
+            }
 
     def print_system_info(self) -> None:
         """Print system information."""
+        console = _console()
         info = self.get_system_info()
 
+        if not console.is_terminal:
+            console.file.write(
+                "\n" + "\n".join(f"{key}\t{value}" for key, value in info.items()) + "\n"
+            )
+            return
+
         table = Table(title="System Information", show_header=False)
         table.add_column("Property", style="cyan", width=20)
         table.add_column("Value", style="green")
@@ -235,27 +583,111 @@ class HealthCheck:
         console.print(table)
 
 
-def run_health_check(verbose: bool = True) -> bool:
+@lru_cache(maxsize=1)
+def _system_info() -> dict[str, str]:
+    """
+    System information, constant for the life of the process.
+
+    Raises if settings cannot be loaded; the failure is not cached.
+    """
+    settings = get_settings()
+    return {
+        "Python Version": _PY_VERSION_STR,
+        "Platform": sys.platform,
+        "Environment": settings.environment,
+        "Primary LLM": settings.primary_llm,
+        "Log Level": settings.log_level,
+        "Max Iterations": str(settings.max_iterations),
+        "Memory Enabled": str(settings.enable_memory),
+    }
+
+
+def run_health_check(verbose: bool = True, force: bool = False) -> bool:
     """
     Run comprehensive health check.
 
     Args:
         verbose: Print detailed results
+        force: Re-run every check instead of reusing recent outcomes
 
     Returns:
         True if all checks pass, False otherwise
     """
     checker = HealthCheck()
-    all_passed = checker.run_all_checks()
+    all_passed = checker.run_all_checks(force=force)
+    _report(checker, verbose)
+    return all_passed
+
+
+async def run_health_check_async(verbose: bool = True, force: bool = False) -> bool:
+    """Async variant of `run_health_check`, for use inside an event loop."""
+    checker = HealthCheck()
+    all_passed = await checker.run_all_checks_async(force=force)
+    _report(checker, verbose)
+    return all_passed
+
+
+def _report(checker: HealthCheck, verbose: bool) -> None:
+    """Publish a full health check run and print it if asked to."""
+    _publish(checker)
 
     if verbose:
         checker.print_results()
         checker.print_system_info()
 
+
+def quick_check(force: bool = False, ttl: float = 5.0) -> bool:
+    """
+    Quick health check without verbose output.
+
+    Reuses the result of the latest `quick_check` or `run_health_check`
+    from the last `ttl` seconds, so concurrent readiness probes share one
+    run. Otherwise stops at the first failing check, since only the
+    overall result is returned.
+
+    Args:
+        force: Re-run every check instead of reusing recent outcomes
+        ttl: Maximum age in seconds of a reusable result
+    """
+    if not force and (latest := _fresh_result(ttl)) is not None:
+        return latest
+
+    checker = HealthCheck()
+    all_passed = checker.run_all_checks(force=force, fail_fast=True)
+    _publish(checker)
     return all_passed
 
 
-def quick_check() -> bool:
-    """Quick health check without verbose output."""
+async def quick_check_async(force: bool = False, ttl: float = 5.0) -> bool:
+    """Async variant of `quick_check`, for use inside an event loop."""
+    if not force and (latest := _fresh_result(ttl)) is not None:
+        return latest
+
     checker = HealthCheck()
-    return checker.run_all_checks()
+    all_passed = await checker.run_all_checks_async(force=force, fail_fast=True)
+    _publish(checker)
+    return all_passed
+
+
+def _fresh_result(ttl: float) -> bool | None:
+    """Overall result of the latest run if it finished within `ttl` seconds."""
+    with _CACHE_LOCK:
+        latest, latest_ts = _latest, _latest_ts
+    if latest is not None and time.monotonic() - latest_ts < ttl:
+        return latest.failed == 0
+    return None
+
+
+def _publish(checker: HealthCheck) -> None:
+    """Make a finished checker the latest one for `quick_check` to reuse."""
+    global _latest, _latest_ts
+    with _CACHE_LOCK:
+        _latest, _latest_ts = checker, time.monotonic()
+
+
+def invalidate_health_cache() -> None:
+    """Forget all cached check outcomes, so the next run redoes every check."""
+    global _latest, _latest_ts
+    with _CACHE_LOCK:
+        _HEALTH_CACHE.clear()
+        _latest, _latest_ts = None, 0.0
@@ -6,11 +6,24 @@ import sys
 
 from loguru import logger
 
-from config.settings import settings
+from config.settings import get_settings
+
+# Set once the handlers are installed, so repeated setup is a no-op
+_configured = False
 
 
 def setup_logger() -> None:
-    """Configure application logger with appropriate handlers."""
+    """
+    Configure application logger with appropriate handlers.
+
+    Only the first call installs handlers; later calls return immediately
+    instead of tearing down and rebuilding every sink.
+    """
+    global _configured
+    if _configured:
+        return
+
+    settings = get_settings()
 
     # Remove default handler
     logger.remove()
@@ -56,6 +69,10 @@ def setup_logger() -> None:
             enqueue=True,
         )
 
+    # Only once every handler is installed; if settings fail to load, a
+    # later call tries again
+    _configured = True
+
     logger.info(f"Logger initialized - Environment: {settings.environment}")
     logger.info(f"Log level: {settings.log_level}")
     logger.info(f"Logs directory: {settings.log_dir}")
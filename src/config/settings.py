@@ -3,23 +3,44 @@ Centralized configuration management using Pydantic Settings.
 Loads from environment variables and .env file.
 """
 
+import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import Field, field_validator
+from dotenv import load_dotenv
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=1)
+def _load_env_file() -> None:
+    """Load `.env` into os.environ once per process, without overriding."""
+    load_dotenv(".env", override=False, encoding="utf-8")
+
+
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """
+    Application settings loaded from environment variables.
+
+    `.env` is loaded into the environment the first time Settings is built,
+    so later instances only read os.environ. Variables already set in the
+    environment take precedence over `.env`.
+    """
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
+        env_file=None,
         case_sensitive=False,
         extra="ignore",
+        # Settings never change once loaded
+        frozen=True,
+        validate_assignment=False,
     )
 
+    def __init__(self, **values: Any) -> None:
+        _load_env_file()
+        super().__init__(**values)
+
     # ==================== Application ====================
     environment: Literal["development", "staging", "production"] = "development"
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
@@ -63,6 +84,7 @@ class Settings(BaseSettings):
     cache_llm_responses: bool = True
     cache_ttl_seconds: int = Field(default=3600, ge=60)
     cache_dir: Path = Field(default=Path("data/cache"))
+    health_cache_ttl_seconds: int = Field(default=30, ge=0)
 
     # ==================== Monitoring ====================
     enable_tracing: bool = True
@@ -73,12 +95,20 @@ class Settings(BaseSettings):
     config_dir: Path = Field(default=Path("config"))
     prompts_dir: Path = Field(default=Path("config/prompts"))
 
-    @field_validator("memory_dir", "cache_dir", "log_dir", "config_dir", "prompts_dir")
-    @classmethod
-    def ensure_path_exists(cls, v: Path) -> Path:
-        """Ensure directory exists."""
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+    @model_validator(mode="after")
+    def ensure_paths_exist(self) -> "Settings":
+        """Ensure directories exist, creating only those that are missing."""
+        for path in (
+            self.memory_dir,
+            self.cache_dir,
+            self.log_dir,
+            self.config_dir,
+            self.prompts_dir,
+        ):
+            # A stat is enough when the directory is already there
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+        return self
 
     @field_validator("groq_api_key")
     @classmethod
@@ -113,21 +143,44 @@ class Settings(BaseSettings):
         else:
             raise ValueError(f"Unsupported LLM: {self.primary_llm}")
 
+    # Derived from `environment` once the model is validated
+    _is_prod: bool = PrivateAttr(default=False)
+    _is_dev: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Work out the environment flags once, after validation."""
+        self._is_prod = self.environment == "production"
+        self._is_dev = self.environment == "development"
+
     @property
     def is_production(self) -> bool:
         """Check if running in production."""
-        return self.environment == "production"
+        return self._is_prod
 
     @property
     def is_development(self) -> bool:
         """Check if running in development."""
-        return self.environment == "development"
-
-
-# Global settings instance
-settings = Settings()
+        return self._is_dev
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+    """
+    Get application settings.
+
+    Settings are loaded (reading `.env` and creating directories) on the
+    first call rather than at import, and shared afterwards.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    """Keep `from config.settings import settings` working, loading lazily."""
+    if name == "settings":
+        warnings.warn(
+            "config.settings.settings is deprecated; use get_settings()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,16 @@ sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(scope="session")
+def health_checker():
+    """HealthCheck that has run every check once, shared by the whole session."""
+    from analyzer.utils.health import HealthCheck
+
+    checker = HealthCheck()
+    checker.run_all_checks(force=True)
+    return checker
+
+
 @pytest.fixture
 def sample_java_code() -> str:
     """Sample Java code for testing."""
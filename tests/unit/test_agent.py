@@ -0,0 +1,193 @@
+"""
+Tests for the code analysis agent.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from analyzer.core.agent import CodeAnalysisAgent
+from analyzer.llm.base import BaseLLM, LLMResponse, Message, ToolCall
+from analyzer.tools.base import BaseTool, ToolParameter
+from analyzer.tools.registry import ToolRegistry
+from analyzer.utils.exceptions import ToolExecutionError
+
+
+class ScriptedLLM(BaseLLM):
+    """LLM stub that replays a fixed list of responses."""
+
+    def __init__(self, responses: list[LLMResponse]):
+        self.responses = list(responses)
+        self.calls: list[list] = []
+
+    def chat(self, messages, tools=None, temperature=None, max_tokens=None, raw_messages=None):
+        self.calls.append(list(messages))
+        return self.responses.pop(0)
+
+    def get_model_name(self) -> str:
+        return "scripted"
+
+
+class BarrierTool(BaseTool):
+    """Tool that only returns once `parties` calls are running at the same time."""
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    @property
+    def name(self) -> str:
+        return "barrier"
+
+    @property
+    def description(self) -> str:
+        return "Waits for concurrent callers"
+
+    def get_parameters(self) -> dict[str, ToolParameter]:
+        return {"label": ToolParameter(name="label", type="string", description="Label")}
+
+    def execute(self, label: str, **kwargs) -> str:
+        if label == "fail":
+            self.barrier.wait()
+            raise ToolExecutionError(self.name, "boom")
+        self.barrier.wait()
+        return f"done {label}"
+
+
+@pytest.fixture
+def registry() -> ToolRegistry:
+    """Registry with a tool that requires concurrent execution."""
+    registry = ToolRegistry()
+    registry.register(BarrierTool(parties=3))
+    return registry
+
+
+class TestToolCallHandling:
+    """Test tool call execution within a turn."""
+
+    def test_parallel_tool_calls_keep_emit_order(self, registry):
+        """Same-turn tool calls run concurrently and are recorded in emit order."""
+        calls = [
+            ToolCall(id="c1", name="barrier", parameters={"label": "a"}),
+            ToolCall(id="c2", name="barrier", parameters={"label": "fail"}),
+            ToolCall(id="c3", name="barrier", parameters={"label": "b"}),
+        ]
+        llm = ScriptedLLM(
+            [
+                LLMResponse(tool_calls=calls),
+                LLMResponse(content="final report"),
+            ]
+        )
+        agent = CodeAnalysisAgent(llm=llm, tool_registry=registry)
+
+        assert agent.analyze_file("Test.java") == "final report"
+
+        tool_messages = [m for m in agent.messages if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_messages] == ["c1", "c2", "c3"]
+        assert tool_messages[0].content == "done a"
+        assert tool_messages[1].content.startswith("ERROR:")
+        assert tool_messages[2].content == "done b"
+
+
+class EchoLLM(BaseLLM):
+    """LLM stub that answers immediately, naming the file it was asked about."""
+
+    def chat(self, messages, tools=None, temperature=None, max_tokens=None, raw_messages=None):
+        request = next(m for m in messages if m.role == "user")
+        file_path = request.content.split("path: ", 1)[1].split()[0]
+        return LLMResponse(content=f"report for {file_path}")
+
+    def get_model_name(self) -> str:
+        return "echo"
+
+
+class TestAsyncAnalysis:
+    """Test concurrent multi-file analysis."""
+
+    def test_analyze_files_uses_separate_conversations(self, registry):
+        """Each file is analyzed in its own conversation."""
+        agent = CodeAnalysisAgent(llm=EchoLLM(), tool_registry=registry)
+
+        reports = asyncio.run(agent.analyze_files(["A.java", "B.java"]))
+
+        assert reports == {"A.java": "report for A.java", "B.java": "report for B.java"}
+        # The parent agent's own conversation is untouched
+        assert len(agent.messages) == 1
+
+    def test_async_loop_runs_streamed_tool_calls(self, registry):
+        """Tool calls from a streamed turn run concurrently, results kept in order."""
+        calls = [
+            ToolCall(id="c1", name="barrier", parameters={"label": "a"}),
+            ToolCall(id="c2", name="barrier", parameters={"label": "b"}),
+            ToolCall(id="c3", name="barrier", parameters={"label": "c"}),
+        ]
+        llm = ScriptedLLM([LLMResponse(tool_calls=calls), LLMResponse(content="final report")])
+        agent = CodeAnalysisAgent(llm=llm, tool_registry=registry)
+
+        assert asyncio.run(agent.analyze_file_async("Test.java")) == "final report"
+
+        tool_messages = [m for m in agent.messages if m.role == "tool"]
+        assert [m.content for m in tool_messages] == ["done a", "done b", "done c"]
+
+
+class TestStreaming:
+    """Test streaming LLM output to a callback."""
+
+    def test_stream_callback_receives_growing_text(self, registry):
+        """The callback sees the current turn's text; the result is the full report."""
+
+        class ChunkedLLM(ScriptedLLM):
+            def stream_chat(self, messages, tools=None, raw_messages=None, **kwargs):
+                yield "final "
+                yield "report"
+                yield LLMResponse(content="final report")
+
+        seen: list[str] = []
+        agent = CodeAnalysisAgent(
+            llm=ChunkedLLM([]), tool_registry=registry, stream_callback=seen.append
+        )
+
+        assert agent.analyze_file("Test.java") == "final report"
+        assert seen == ["final ", "final report"]
+
+
+class TestHistoryCompaction:
+    """Test bounding the conversation sent to the LLM."""
+
+    def test_old_tool_results_truncated_over_budget(self, registry):
+        """Old tool results shrink once the history exceeds the budget."""
+
+        class SmallContextLLM(ScriptedLLM):
+            def get_token_limit(self) -> int:
+                return 2000
+
+        llm = SmallContextLLM([LLMResponse(content="final report")])
+        agent = CodeAnalysisAgent(llm=llm, tool_registry=registry)
+        for i in range(5):
+            agent._add_message(
+                Message(role="tool", content="x" * 2000, tool_call_id=f"c{i}", name="barrier")
+            )
+
+        agent.analyze_file("Test.java")
+
+        tool_messages = [m for m in agent.messages if m.role == "tool"]
+        assert all(len(m.content) < 600 for m in tool_messages[:2])
+        assert all(m.content == "x" * 2000 for m in tool_messages[2:])
+        assert agent._api_messages == [m.to_dict() for m in agent.messages]
+
+
+class TestSystemPrompt:
+    """Test how the system prompt is sent."""
+
+    def test_fold_system_prompt_into_first_request(self, registry):
+        """With folding on, the first message is a user message carrying the prompt."""
+        llm = ScriptedLLM([LLMResponse(content="final report")])
+        agent = CodeAnalysisAgent(llm=llm, tool_registry=registry, fold_system_prompt=True)
+
+        agent.analyze_file("Test.java")
+
+        first_turn = llm.calls[0]
+        assert [m.role for m in first_turn] == ["user"]
+        assert first_turn[0].content.startswith(CodeAnalysisAgent.SYSTEM_PROMPT)
+        assert "Test.java" in first_turn[0].content
+        assert agent._api_messages == [m.to_dict() for m in agent.messages]
@@ -0,0 +1,67 @@
+"""
+Tests for the Groq LLM client.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from analyzer.llm.base import LLMResponse, ToolCall
+from analyzer.llm.groq_client import GroqLLMClient, _StreamAssembler
+from analyzer.utils.exceptions import LLMResponseError
+
+
+def chunk(content=None, tool_calls=None, finish_reason=None):
+    """Build a fake streamed chat completion chunk."""
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)])
+
+
+def fragment(index, call_id=None, name=None, arguments=None):
+    """Build a fake streamed tool call fragment."""
+    function = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(index=index, id=call_id, function=function)
+
+
+@pytest.fixture
+def assembler() -> _StreamAssembler:
+    """Stream assembler using the Groq client's tool call parsing."""
+    client = GroqLLMClient.__new__(GroqLLMClient)
+    return _StreamAssembler(client._make_tool_call)
+
+
+class TestStreamAssembler:
+    """Test rebuilding responses from streamed chunks."""
+
+    def test_tool_call_emitted_when_next_one_starts(self, assembler):
+        """A tool call is yielded as soon as the following call begins."""
+        assert list(assembler.feed(chunk(content="Reading"))) == ["Reading"]
+        assert (
+            list(assembler.feed(chunk(tool_calls=[fragment(0, "c1", "read_file", '{"file_')])))
+            == []
+        )
+        assert (
+            list(assembler.feed(chunk(tool_calls=[fragment(0, arguments='path": "A.java"}')])))
+            == []
+        )
+
+        emitted = list(
+            assembler.feed(chunk(tool_calls=[fragment(1, "c2", "static_analysis", "{}")]))
+        )
+        assert emitted == [ToolCall(id="c1", name="read_file", parameters={"file_path": "A.java"})]
+
+        assert list(assembler.feed(chunk(finish_reason="tool_calls"))) == []
+        assert list(assembler.finish()) == [ToolCall(id="c2", name="static_analysis")]
+
+        response = assembler.response()
+        assert isinstance(response, LLMResponse)
+        assert response.content == "Reading"
+        assert [tc.id for tc in response.tool_calls] == ["c1", "c2"]
+        assert response.finish_reason == "tool_calls"
+
+    def test_invalid_arguments_raise_response_error(self, assembler):
+        """Malformed tool call JSON is reported as an invalid response."""
+        list(assembler.feed(chunk(tool_calls=[fragment(0, "c1", "read_file", "[1, 2]")])))
+
+        with pytest.raises(LLMResponseError):
+            list(assembler.finish())
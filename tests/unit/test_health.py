@@ -2,9 +2,23 @@
 Tests for health check system.
 """
 
+import asyncio
+import io
+
 import pytest
+from rich.console import Console
+
+from analyzer.utils import health
+from analyzer.utils.health import (
+    CheckResult,
+    HealthCheck,
+    invalidate_health_cache,
+    quick_check,
+    quick_check_async,
+)
 
-from analyzer.utils.health import HealthCheck, quick_check
+# Health checks share filesystem probes; keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("health-io")
 
 
 class TestHealthCheck:
@@ -22,10 +36,20 @@ class TestHealthCheck:
         checker.add_check("Test Check", True, "Test passed")
 
         assert len(checker.checks) == 1
-        name, passed, message = checker.checks[0]
-        assert name == "Test Check"
-        assert passed is True
-        assert message == "Test passed"
+        result = checker.checks[0]
+        assert result.name == "Test Check"
+        assert result.passed is True
+        assert result.message == "Test passed"
+
+    def test_failed_count_follows_checks(self):
+        """The failure count reflects results appended or cleared directly."""
+        checker = HealthCheck()
+        checker.add_check("Test Check", True, "ok")
+        checker.checks.append(CheckResult("Other Check", False, "bad"))
+        assert checker.failed == 1
+
+        checker.checks.clear()
+        assert checker.failed == 0
 
     def test_check_python_version(self):
         """Test Python version check."""
@@ -36,30 +60,47 @@ class TestHealthCheck:
         assert result is True
         assert len(checker.checks) == 1
 
-    def test_check_dependencies(self):
+    def test_check_dependencies(self, health_checker):
         """Test dependency check."""
-        checker = HealthCheck()
-        result = checker.check_dependencies()
+        results = [
+            result.passed for result in health_checker.checks if result.name.startswith("Package:")
+        ]
 
         # Should pass if all dependencies are installed
-        assert result is True
-        assert len(checker.checks) > 0
+        assert len(results) > 0
+        assert all(results)
 
-    def test_check_settings_load(self):
+    def test_check_settings_load(self, health_checker):
         """Test settings loading check."""
-        checker = HealthCheck()
-        result = checker.check_settings_load()
+        results = [result.passed for result in health_checker.checks if result.name == "Settings"]
 
         # Should pass if settings load correctly
-        assert result is True
+        assert results == [True]
 
-    def test_check_directories(self):
+    def test_check_directories(self, health_checker):
         """Test directory existence check."""
-        checker = HealthCheck()
-        result = checker.check_directories()
+        results = [
+            result.passed
+            for result in health_checker.checks
+            if result.name.startswith("Directory:")
+        ]
 
         # Should pass since directories are created by settings
-        assert result is True
+        assert len(results) == 5
+        assert all(results)
+
+    def test_probe_dirs(self, tmp_path):
+        """Directories are stat'ed once and write-tested on request."""
+        missing = tmp_path / "missing"
+        checker = HealthCheck()
+
+        probes = checker._probe_dirs([tmp_path, missing], write=True)
+
+        assert probes[tmp_path] == (True, None)
+        assert probes[missing][0] is False
+        assert probes[missing][1] is not None
+        assert list(tmp_path.iterdir()) == []
+        assert checker._dir_stats == {tmp_path: True, missing: False}
 
     def test_get_system_info(self):
         """Test getting system information."""
@@ -71,6 +112,123 @@ class TestHealthCheck:
         assert "Environment" in info
         assert "Primary LLM" in info
 
+    def test_get_system_info_without_settings(self, monkeypatch):
+        """Settings that fail to load show as unavailable instead of raising."""
+
+        def broken():
+            raise ValueError("GROQ_API_KEY is required")
+
+        monkeypatch.setattr(health, "_system_info", broken)
+        info = HealthCheck().get_system_info()
+
+        assert info["Platform"]
+        assert info["Primary LLM"] == "unavailable"
+
+    def test_run_all_checks_keeps_order(self):
+        """Concurrent checks are reported in a fixed order."""
+        checker = HealthCheck()
+        checker.run_all_checks()
+
+        names = [result.name for result in checker.checks]
+        assert names[0] == "Python Version"
+        assert names[-1] in ("LLM API Key", "LLM")
+        assert names.index("Settings") < names.index("Env: ENVIRONMENT")
+
+    def test_crashing_check_fails(self, monkeypatch):
+        """A check that raises is recorded as failed."""
+
+        def broken(self):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(HealthCheck, "check_settings_load", broken)
+        checker = HealthCheck()
+
+        assert checker.run_all_checks(force=True) is False
+        assert CheckResult("Settings", False, "✗ Error: boom") in checker.checks
+
+    def test_interrupted_check_propagates(self):
+        """Interrupts are re-raised rather than recorded as check failures."""
+        checker = HealthCheck()
+
+        with pytest.raises(KeyboardInterrupt):
+            checker._record_outcome("check_settings_load", KeyboardInterrupt())
+        assert checker.checks == []
+
+    def test_fail_fast_skips_remaining_checks(self, monkeypatch):
+        """With fail_fast, checks after the first failure are skipped."""
+
+        def missing(self):
+            self.add_check("Package: groq", False, "✗ Groq API client")
+            return False
+
+        def unreachable(self):
+            pytest.fail("check ran after an earlier failure")
+
+        monkeypatch.setattr(health, "_HEALTH_CACHE", {})
+        monkeypatch.setattr(HealthCheck, "check_dependencies", missing)
+        monkeypatch.setattr(HealthCheck, "check_llm_connectivity", unreachable)
+        checker = HealthCheck()
+
+        assert checker.run_all_checks(fail_fast=True) is False
+        assert [result.name for result in checker.checks[:2]] == ["Python Version", "Package: groq"]
+        assert checker.checks[-1] == CheckResult(
+            "LLM API Key",
+            False,
+            "- Skipped: an earlier check failed",
+        )
+
+    def test_checks_run_without_settings(self, monkeypatch):
+        """Checks that do not need settings still pass when settings fail to load."""
+
+        def broken():
+            raise ValueError("GROQ_API_KEY is required")
+
+        monkeypatch.setattr(health, "_HEALTH_CACHE", {})
+        monkeypatch.setattr(health, "get_settings", broken)
+        checker = HealthCheck()
+
+        assert checker.run_all_checks() is False
+        results = {result.name: result.passed for result in checker.checks}
+        assert results["Python Version"] is True
+        assert results["Package: groq"] is True
+        assert results["Settings"] is False
+
+    def test_check_outcomes_cached(self, monkeypatch):
+        """Recent check outcomes are reused unless forced."""
+        calls = []
+
+        def counting(self):
+            calls.append(1)
+            self.add_check("Python Version", True, "counted")
+            return True
+
+        monkeypatch.setattr(health, "_HEALTH_CACHE", {})
+        monkeypatch.setattr(HealthCheck, "check_python_version", counting)
+
+        HealthCheck().run_all_checks()
+        checker = HealthCheck()
+        checker.run_all_checks()
+        assert len(calls) == 1
+        assert checker.checks[0] == CheckResult("Python Version", True, "counted")
+
+        HealthCheck().run_all_checks(force=True)
+        assert len(calls) == 2
+
+    def test_print_results_plain_when_not_terminal(self, monkeypatch):
+        """Output to a non-terminal console is plain lines instead of a table."""
+        buffer = io.StringIO()
+        console = Console(file=buffer, force_terminal=False)
+        monkeypatch.setattr(health, "_console", lambda: console)
+        checker = HealthCheck()
+        checker.add_check("Test Check", True, "ok")
+        checker.add_check("Other Check", False, "bad")
+
+        checker.print_results()
+
+        out = buffer.getvalue()
+        assert "Test Check\tPASS\tok\nOther Check\tFAIL\tbad\n" in out
+        assert "1/2 checks failed" in out
+
     def test_quick_check(self):
         """Test quick check function."""
         result = quick_check()
@@ -78,6 +236,38 @@ class TestHealthCheck:
         # Should return a boolean
         assert isinstance(result, bool)
 
+    def test_quick_check_inside_event_loop(self):
+        """The sync and async quick checks both work from a running loop."""
+
+        async def probe():
+            return quick_check(force=True), await quick_check_async(force=True)
+
+        sync_result, async_result = asyncio.run(probe())
+
+        assert sync_result == async_result
+        assert isinstance(sync_result, bool)
+
+    def test_quick_check_reuses_latest_result(self, monkeypatch):
+        """A fresh result is reused until the cache is invalidated."""
+
+        def run_checks(passed):
+            def run_all_checks(self, **kwargs):
+                self.add_check("Check", passed, "")
+                return passed
+
+            return run_all_checks
+
+        invalidate_health_cache()
+        monkeypatch.setattr(HealthCheck, "run_all_checks", run_checks(False))
+        assert quick_check() is False
+
+        monkeypatch.setattr(HealthCheck, "run_all_checks", run_checks(True))
+        assert quick_check() is False
+
+        invalidate_health_cache()
+        assert quick_check() is True
+        invalidate_health_cache()
+
 
 @pytest.mark.integration
 class TestHealthCheckIntegration:
@@ -0,0 +1,159 @@
+"""
+Tests for the code analysis tools.
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from analyzer.tools.code.complexity import ComplexityAnalysisTool
+from analyzer.tools.code.reader import ReadFileTool
+from analyzer.tools.code.static_analyzer import StaticAnalysisTool
+from analyzer.tools.registry import ToolRegistry, read_source
+from analyzer.utils.exceptions import ToolExecutionError
+
+
+class TestReadFileTool:
+    """Test reading Java files."""
+
+    def test_numbers_lines(self, temp_java_file):
+        """Contents are returned with line numbers."""
+        report = ReadFileTool().execute(str(temp_java_file))
+
+        assert "   2 | public class SampleCode {" in report
+
+    @pytest.mark.parametrize(
+        "name, message",
+        [("Missing.java", "File not found"), ("Dir.java", "Path is not a file")],
+    )
+    def test_invalid_paths(self, tmp_path, name, message):
+        """Missing files and directories are reported as tool errors."""
+        (tmp_path / "Dir.java").mkdir()
+
+        with pytest.raises(ToolExecutionError, match=message):
+            ReadFileTool().execute(str(tmp_path / name))
+
+
+class TestComplexityAnalysisTool:
+    """Test complexity metrics."""
+
+    def test_classify_lines(self):
+        """Each line is counted once as code, comment or blank."""
+        lines = [
+            "/**",
+            " * Javadoc",
+            " */",
+            "public class A {",
+            "    /* inline block */",
+            "",
+            "    // single line",
+            "    int x = 1;",
+            "    /* multi",
+            "",
+            "       line */",
+            "}",
+        ]
+
+        counts = ComplexityAnalysisTool()._classify_lines(lines)
+
+        assert counts == {"code_lines": 3, "comment_lines": 7, "blank_lines": 2}
+
+    def test_execute_reports_metrics(self, temp_java_file):
+        """The report includes the size metrics for the file."""
+        report = ComplexityAnalysisTool().execute(str(temp_java_file))
+
+        assert "Test.java" in report
+        assert "Methods:                2" in report
+
+    def test_report_refreshed_when_file_changes(self, temp_java_file):
+        """A cached report is only reused while the file is unchanged."""
+        tool = ComplexityAnalysisTool()
+        first = tool.execute(str(temp_java_file))
+
+        assert tool.execute(str(temp_java_file)) is first
+
+        temp_java_file.write_text("public class Test {\n}\n")
+        assert "Methods:                0" in tool.execute(str(temp_java_file))
+
+    def test_report_cache_does_not_keep_tool_alive(self, temp_java_file):
+        """Cached reports belong to the tool and are freed with it."""
+        tool = ComplexityAnalysisTool()
+        tool.execute(str(temp_java_file))
+        ref = weakref.ref(tool)
+
+        del tool
+        gc.collect()
+
+        assert ref() is None
+
+
+class TestStaticAnalysisTool:
+    """Test static analysis checks."""
+
+    def test_detects_issues(self, tmp_path, bad_java_code):
+        """Issues are reported under their severity with line numbers."""
+        java_file = tmp_path / "Bad.java"
+        java_file.write_text(bad_java_code)
+
+        report = StaticAnalysisTool().execute(str(java_file))
+
+        assert "Line    5: Potential SQL injection - SELECT statement" in report
+        assert "PRIORITY: Address security issues immediately!" in report
+
+
+class TestReadSource:
+    """Test the source file cache shared by the tools."""
+
+    def test_contents_shared_until_file_changes(self, temp_java_file):
+        """Repeated reads share one copy; an edited file is read again."""
+        source = read_source(temp_java_file)
+
+        assert read_source(temp_java_file) is source
+        assert source.text == source.data.decode("utf-8")
+        assert source.lines == source.text.splitlines()
+
+        temp_java_file.write_text("class Changed {}")
+        assert read_source(temp_java_file).lines == ["class Changed {}"]
+
+    def test_lines_split_on_newline_only(self, tmp_path):
+        """A form feed in a comment does not shift line numbers between tools."""
+        java_file = tmp_path / "Paged.java"
+        java_file.write_bytes(
+            b"public class Paged {\r\n"
+            b"    // page\x0cbreak\n"
+            b"    void run() {\n"
+            b"        int x = 1;\n"
+            b"        try { x++; } catch (Exception e) {} System.out.println(x);\n"
+            b"    }\n"
+            b"}\n"
+        )
+
+        lines = read_source(java_file).lines
+        assert len(lines) == 7
+        assert lines[0] == "public class Paged {"
+
+        report = StaticAnalysisTool().execute(str(java_file))
+        assert "Line    5: Empty catch block" in report
+        assert "Line    5: Using System.out" in report
+        assert "   5 |         try" in ReadFileTool().execute(str(java_file))
+
+
+class TestToolRegistry:
+    """Test the tool registry."""
+
+    def test_schemas_cached_until_tools_change(self):
+        """The schema list is reused until the set of tools changes."""
+        registry = ToolRegistry()
+        registry.register(ReadFileTool())
+        schemas = registry.get_tool_schemas()
+
+        assert registry.get_tool_schemas() is schemas
+
+        registry.register(ComplexityAnalysisTool())
+        assert len(registry.get_tool_schemas()) == 2
+
+        registry.unregister("read_file")
+        assert [s["function"]["name"] for s in registry.get_tool_schemas()] == [
+            "complexity_analysis"
+        ]